@@ -1,41 +1,113 @@
 """Main entry point for running ESXi MCP Server as a module."""
 
+import gc
 import os
+import sys
+import asyncio
+import queue
+import atexit
 import argparse
 import logging
+import logging.handlers
+from dataclasses import dataclass
+from typing import List, Optional
+
 import anyio
 import uvicorn
 
 from mcp.server import stdio
 
+try:
+    import uvloop
+except ImportError:
+    # uvloop is not available on Windows; fall back to the stdlib event loop
+    uvloop = None
+
 from . import load_config, VMwareManager, ToolHandlers, create_mcp_server, register_handlers
 from .transport import create_asgi_app
 
 
 def setup_logging(config):
-    """Configure logging based on configuration."""
+    """
+    Configure logging based on configuration.
+    
+    Log calls only enqueue the record; a background QueueListener thread
+    formats it and writes it to the single file or console handler.
+    """
     log_level = getattr(logging, config.log_level.upper(), logging.INFO)
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        filename=config.log_file if config.log_file else None
-    )
-    if not config.log_file:
+    if config.log_file:
+        handler = logging.FileHandler(config.log_file, encoding="utf-8")
+    else:
         # If no log file is specified, output logs to the console
-        logging.getLogger().addHandler(logging.StreamHandler())
+        handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    # Flush any queued records on interpreter shutdown
+    atexit.register(listener.stop)
+    
+    root = logging.getLogger()
+    root.setLevel(log_level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
 
 
-def main():
-    """Main entry point."""
-    # Parse command-line arguments
+@dataclass(frozen=True, slots=True)
+class CliArgs:
+    """Parsed command-line options."""
+    config_path: Optional[str] = None  # Configuration file path (JSON or YAML)
+    transport: str = "http"            # Transport mode: "stdio" or "http"
+
+
+def parse_args(argv: Optional[List[str]] = None) -> CliArgs:
+    """
+    Parse command-line arguments, falling back to MCP_CONFIG_FILE for the config path.
+    
+    Args:
+        argv: Argument list to parse (defaults to sys.argv[1:])
+        
+    Returns:
+        CliArgs with the resolved options
+    """
     parser = argparse.ArgumentParser(description="MCP VMware ESXi Management Server")
     parser.add_argument("--config", "-c", help="Configuration file path (JSON or YAML)", default=None)
     parser.add_argument("--transport", "-t", choices=["stdio", "http"], default="http",
                         help="Transport mode: 'stdio' for stdin/stdout communication (default: http)")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    return CliArgs(
+        config_path=args.config or os.environ.get("MCP_CONFIG_FILE"),
+        transport=args.transport
+    )
+
+
+async def _serve_http(app, config):
+    """Serve the ASGI app with uvicorn on the already running event loop."""
+    # Driving Server.serve() directly keeps uvicorn and the app's background
+    # tasks on the one loop we started, so no loop setup option is passed
+    server_config = uvicorn.Config(
+        app,
+        host="0.0.0.0",
+        port=8080,
+        http="httptools",
+        ws="none",
+        log_level=config.log_level.lower()
+    )
+    await uvicorn.Server(server_config).serve()
+
+
+def run(config_path: Optional[str] = None, transport: str = "http"):
+    """
+    Load configuration and serve MCP requests until shutdown.
+    
+    Args:
+        config_path: Configuration file path (JSON or YAML); None to use environment variables only
+        transport: "stdio" for stdin/stdout communication or "http" for the HTTP transport
+    """
+    if transport not in ("stdio", "http"):
+        raise ValueError(f"Unsupported transport: {transport}")
     
     # Load configuration
-    config_path = args.config or os.environ.get("MCP_CONFIG_FILE")
     config = load_config(config_path)
     
     # Initialize logging
@@ -54,26 +126,42 @@ def main():
     tool_handlers = ToolHandlers(manager, config)
     mcp_server = create_mcp_server()
     register_handlers(mcp_server, tool_handlers)
+    # Build the initialization options once, before any transport I/O starts
+    init_opts = mcp_server.create_initialization_options()
+    
+    # Move everything allocated during startup (schemas, validators, handler maps,
+    # the vSphere connection) out of the collector's view, and collect the young
+    # generation less often since responses churn through short-lived dicts
+    gc.collect()
+    gc.freeze()
+    gc.set_threshold(50_000, 20, 10)
     
     # Start MCP server with the selected transport
-    if args.transport == "stdio":
+    if transport == "stdio":
         # Run with stdio transport (stdin/stdout communication)
         logging.info("Starting MCP server with stdio transport")
         
         async def run_stdio():
             async with stdio.stdio_server() as (read_stream, write_stream):
-                init_opts = mcp_server.create_initialization_options()
                 await mcp_server.run(read_stream, write_stream, init_opts)
         
-        anyio.run(run_stdio)
+        # The handlers dispatch through asyncio executors, so only the asyncio backend is supported
+        anyio.run(run_stdio, backend="asyncio",
+                  backend_options={"use_uvloop": uvloop is not None})
     else:
         # Run with HTTP transport (default)
         logging.info("Starting MCP server with HTTP transport on 0.0.0.0:8080")
         
-        # Create ASGI app
-        import asyncio
-        app = asyncio.run(create_asgi_app(mcp_server, config))
-        uvicorn.run(app, host="0.0.0.0", port=8080)
+        app = create_asgi_app(mcp_server, config, init_opts)
+        if uvloop is not None:
+            uvloop.run(_serve_http(app, config))
+        else:
+            asyncio.run(_serve_http(app, config))
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+    run(args.config_path, args.transport)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,12 @@
 """Configuration management for ESXi MCP Server."""
 
 import os
-import json
+import stat
 from dataclasses import dataclass
 from typing import Optional
 
+from . import jsonlib
+
 
 @dataclass
 class Config:
@@ -23,6 +25,63 @@ class Config:
     log_level: str = "INFO"            # Log level
     max_retries: int = 3               # Maximum reconnection attempts on session failure
     retry_delay_seconds: float = 5.0   # Delay between reconnection attempts (seconds)
+    pretty_json: bool = True           # Indent JSON tool results (disable to shrink large responses)
+    vsphere_pool_size: int = 32        # Worker threads for concurrent blocking vSphere calls
+    inventory_ttl: float = 15.0        # Seconds to cache read-only inventory results (0 disables)
+    index_ttl: float = 30.0            # Seconds to reuse the VM/host name index for lookups (0 disables)
+    fetch_concurrency: int = 8         # Concurrent property queries when a batch tool reads many objects
+    task_timeout: float = 3600.0       # Seconds to wait for a vCenter task before failing the call (0 waits indefinitely)
+    host_power_on_limit: int = 60      # Concurrent power-on tasks per ESXi host (0 disables the limit)
+    host_snapshot_limit: int = 10      # Concurrent snapshot-creation tasks per ESXi host (0 disables the limit)
+    max_concurrent_tasks: int = 600    # Concurrent vCenter tasks started by this server (0 disables the limit)
+
+
+def _load_yaml(config_path: str) -> dict:
+    """
+    Load a YAML configuration file through a JSON sidecar cache.
+    
+    The parsed YAML is written next to the file as ``<config_path>.cache.json``
+    together with the YAML's (mtime, size, inode), and reused on later starts only
+    while all three still match exactly.
+    """
+    cache_path = f"{config_path}.cache.json"
+    source_stat = os.stat(config_path)
+    # Exact match rather than "cache is newer": cp -p, rsync -t, restored backups and
+    # symlink swaps can all put an older or same-tick mtime on a changed file
+    source = [source_stat.st_mtime_ns, source_stat.st_size, source_stat.st_ino]
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = jsonlib.loads(f.read())
+        if isinstance(cached, dict) and cached.get("source") == source:
+            return cached["config"]
+    except (OSError, ValueError, KeyError):
+        pass  # Missing, unreadable or corrupt cache: parse the YAML instead
+
+    import yaml
+    # The libyaml-backed loader is much faster; fall back when PyYAML was built without it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(config_path, 'r') as f:
+        config_data = yaml.load(f, Loader=loader)
+
+    # The cache holds credentials: create the temporary file with the YAML's
+    # permissions before anything is written, then swap it in atomically.
+    # A read-only config directory just skips the cache
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, stat.S_IMODE(source_stat.st_mode))
+    except OSError:
+        return config_data
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(jsonlib.dumps({"source": source, "config": config_data}))
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+    return config_data
 
 
 def load_config(config_path: Optional[str] = None) -> Config:
@@ -44,12 +103,10 @@ def load_config(config_path: Optional[str] = None) -> Config:
     # Load from file if path is provided
     if config_path:
         if config_path.endswith((".yml", ".yaml")):
-            import yaml
-            with open(config_path, 'r') as f:
-                config_data = yaml.safe_load(f)
+            config_data = _load_yaml(config_path)
         elif config_path.endswith(".json"):
-            with open(config_path, 'r') as f:
-                config_data = json.load(f)
+            with open(config_path, 'rb') as f:
+                config_data = jsonlib.loads(f.read())
         else:
             raise ValueError("Unsupported configuration file format. Please use JSON or YAML")
     
@@ -68,18 +125,28 @@ def load_config(config_path: Optional[str] = None) -> Config:
         "MCP_LOG_FILE": "log_file",
         "MCP_LOG_LEVEL": "log_level",
         "MCP_MAX_RETRIES": "max_retries",
-        "MCP_RETRY_DELAY_SECONDS": "retry_delay_seconds"
+        "MCP_RETRY_DELAY_SECONDS": "retry_delay_seconds",
+        "MCP_PRETTY_JSON": "pretty_json",
+        "MCP_VSPHERE_POOL_SIZE": "vsphere_pool_size",
+        "MCP_INVENTORY_TTL": "inventory_ttl",
+        "MCP_INDEX_TTL": "index_ttl",
+        "MCP_FETCH_CONCURRENCY": "fetch_concurrency",
+        "MCP_TASK_TIMEOUT": "task_timeout",
+        "MCP_HOST_POWER_ON_LIMIT": "host_power_on_limit",
+        "MCP_HOST_SNAPSHOT_LIMIT": "host_snapshot_limit",
+        "MCP_MAX_CONCURRENT_TASKS": "max_concurrent_tasks"
     }
 
     for env_key, cfg_key in env_map.items():
         if env_key in os.environ:
             val = os.environ[env_key]
             # Boolean type conversion
-            if cfg_key in ("insecure", "saml_enabled"):
+            if cfg_key in ("insecure", "saml_enabled", "pretty_json"):
                 config_data[cfg_key] = val.lower() in ("1", "true", "yes")
-            elif cfg_key == "max_retries":
+            elif cfg_key in ("max_retries", "vsphere_pool_size", "fetch_concurrency",
+                             "host_power_on_limit", "host_snapshot_limit", "max_concurrent_tasks"):
                 config_data[cfg_key] = int(val)
-            elif cfg_key == "retry_delay_seconds":
+            elif cfg_key in ("retry_delay_seconds", "inventory_ttl", "index_ttl", "task_timeout"):
                 config_data[cfg_key] = float(val)
             else:
                 config_data[cfg_key] = val
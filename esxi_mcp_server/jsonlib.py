@@ -0,0 +1,35 @@
+"""JSON encoding and decoding, using orjson when it is installed."""
+
+import dataclasses
+
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup; the standard library produces the same output
+    orjson = None
+    import json
+
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(obj, indent: bool = False) -> str:
+        """Serialize obj to a JSON string, indented by two spaces if indent is set."""
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode("utf-8")
+else:
+    loads = json.loads
+
+    def _default(obj):
+        # orjson serializes dataclasses natively; do the same for the records in models.py
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps(obj, indent: bool = False) -> str:
+        """Serialize obj to a JSON string, indented by two spaces if indent is set."""
+        if indent:
+            return json.dumps(obj, indent=2, ensure_ascii=False, default=_default)
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default)
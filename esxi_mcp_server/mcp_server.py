@@ -1,12 +1,76 @@
 """MCP server initialization and handler registration."""
 
-import json
+import asyncio
+import functools
+import importlib.resources
+from concurrent.futures import ThreadPoolExecutor
+
+import fastjsonschema
 from mcp.server.lowlevel import Server
 from mcp import types
 
+from . import jsonlib
 from .tools import ToolHandlers
 
 
+# Tool schemas (name, description, inputSchema) live in tool_schemas.json so
+# that import only pays for a single JSON parse instead of building the
+# equivalent Python literals
+_TOOL_SCHEMAS = jsonlib.loads(
+    importlib.resources.files(__package__).joinpath("tool_schemas.json").read_bytes()
+)
+_TOOLS_BY_NAME = {entry["name"]: types.Tool(**entry) for entry in _TOOL_SCHEMAS}
+
+# Input validators generated once per tool schema; use_default=False keeps schema
+# defaults out of the arguments so handler method defaults still apply
+_TOOL_VALIDATORS = {
+    entry["name"]: fastjsonschema.compile(entry["inputSchema"], use_default=False)
+    for entry in _TOOL_SCHEMAS
+}
+
+_RESOURCES_BY_NAME = {
+    "vmStats": types.Resource(
+        name="vmStats",
+        uri="vmstats://{vm_name}",
+        description="Get CPU, memory, storage, network usage of a VM",
+        mimeType="application/json"
+    )
+}
+
+# Tools that stream files to or from vSphere over HTTP and can hold a thread for
+# minutes; they get their own pool so they cannot starve short inventory calls
+_TRANSFER_TOOLS = frozenset({
+    "upload_file_to_vm", "upload_file_to_datastore", "deploy_ovf", "deploy_ova",
+})
+
+# Tools that block until background jobs, vCenter tasks or property updates arrive,
+# for up to their timeout; like transfers they run on a pool of their own
+_WAIT_TOOLS = frozenset({
+    "wait_for_task", "join_vcenter_tasks", "wait_for_updates",
+})
+
+# Tool and resource listings never change at runtime, so build them once
+_TOOLS_LIST = tuple(_TOOLS_BY_NAME.values())
+_RESOURCES_LIST = tuple(_RESOURCES_BY_NAME.values())
+
+# list_tools always returns the same payload; build the result model once so the
+# framework neither re-validates the tool list nor rebuilds its tool cache per request
+_LIST_TOOLS_RESULT = types.ListToolsResult(tools=list(_TOOLS_LIST))
+
+# (URI prefix, resource name) pairs, longest prefix first, so that reads do not
+# re-split the URI templates on every request
+_RESOURCE_PREFIXES = tuple(sorted(
+    ((str(resource.uri).split("{", 1)[0], name) for name, resource in _RESOURCES_BY_NAME.items()),
+    key=lambda item: len(item[0]),
+    reverse=True
+))
+
+
+def _text(content: str) -> types.TextContent:
+    """Build a TextContent without re-validating the constant type="text" field."""
+    return types.TextContent.model_construct(type="text", text=content)
+
+
 def create_mcp_server() -> Server:
     """Create and initialize the MCP server."""
     return Server(name="VMware-MCP-Server", version="0.0.1")
@@ -20,485 +84,59 @@ def register_handlers(mcp_server: Server, tool_handlers: ToolHandlers):
         mcp_server: The MCP Server instance
         tool_handlers: The ToolHandlers instance containing handler methods
     """
-    # Define tools with proper MCP Tool schema (name, description, inputSchema only)
-    tools = {
-        "create_vm": types.Tool(
-            name="create_vm",
-            description="Create a new virtual machine",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "VM name"},
-                    "cpu": {"type": "integer", "description": "Number of CPUs"},
-                    "memory": {"type": "integer", "description": "Memory in MB"},
-                    "datastore": {"type": "string", "description": "Datastore name (optional, takes precedence over datastore_cluster)"},
-                    "datastore_cluster": {"type": "string", "description": "Datastore cluster (StoragePod) name — picks the datastore with most free space (optional)"},
-                    "network": {"type": "string", "description": "Network name (optional)"},
-                    "folder": {"type": "string", "description": "Target VM folder name (optional)"},
-                    "resource_pool": {"type": "string", "description": "Target resource pool name (optional)"},
-                    "serial_console": {"type": "boolean", "description": "Add a file-backed serial port for console logging", "default": False}
-                },
-                "required": ["name", "cpu", "memory"]
-            }
-        ),
-        "clone_vm": types.Tool(
-            name="clone_vm",
-            description="Clone a virtual machine from a template or existing VM",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "template_name": {"type": "string", "description": "Name of the template or VM to clone"},
-                    "new_name": {"type": "string", "description": "Name for the new VM"},
-                    "folder": {"type": "string", "description": "Target VM folder name (optional)"},
-                    "resource_pool": {"type": "string", "description": "Target resource pool name (optional)"},
-                    "datastore": {"type": "string", "description": "Target datastore name (optional, takes precedence over datastore_cluster)"},
-                    "datastore_cluster": {"type": "string", "description": "Datastore cluster (StoragePod) name — picks the datastore with most free space (optional)"}
-                },
-                "required": ["template_name", "new_name"]
-            }
-        ),
-        "delete_vm": types.Tool(
-            name="delete_vm",
-            description="Delete a virtual machine",
-            inputSchema={
-                "type": "object",
-                "properties": {"name": {"type": "string", "description": "VM name"}},
-                "required": ["name"]
-            }
-        ),
-        "power_on_vm": types.Tool(
-            name="power_on_vm",
-            description="Power on a virtual machine",
-            inputSchema={
-                "type": "object",
-                "properties": {"name": {"type": "string", "description": "VM name"}},
-                "required": ["name"]
-            }
-        ),
-        "power_off_vm": types.Tool(
-            name="power_off_vm",
-            description="Power off a virtual machine",
-            inputSchema={
-                "type": "object",
-                "properties": {"name": {"type": "string", "description": "VM name"}},
-                "required": ["name"]
-            }
-        ),
-        "list_vms": types.Tool(
-            name="list_vms",
-            description="List all virtual machines",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        "get_vm_details": types.Tool(
-            name="get_vm_details",
-            description="Get detailed information about a specific virtual machine",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vm_name": {"type": "string", "description": "Name of the virtual machine"}
-                },
-                "required": ["vm_name"]
-            }
-        ),
-        "get_vm_performance": types.Tool(
-            name="get_vm_performance",
-            description="Get performance data for a virtual machine",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vm_name": {"type": "string", "description": "Name of the virtual machine"}
-                },
-                "required": ["vm_name"]
-            }
-        ),
-        "get_vm_summary_stats": types.Tool(
-            name="get_vm_summary_stats",
-            description="Get summary statistics for a virtual machine",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vm_name": {"type": "string", "description": "Name of the virtual machine"}
-                },
-                "required": ["vm_name"]
-            }
-        ),
-        "create_vm_custom": types.Tool(
-            name="create_vm_custom",
-            description="Create a custom virtual machine with advanced configuration options",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "VM name"},
-                    "cpu": {"type": "integer", "description": "Number of CPUs"},
-                    "memory": {"type": "integer", "description": "Memory in MB"},
-                    "disk_size_gb": {"type": "integer", "description": "Disk size in GB", "default": 10},
-                    "guest_id": {"type": "string", "description": "Guest OS identifier", "default": "otherGuest"},
-                    "datastore": {"type": "string", "description": "Datastore name (optional, takes precedence over datastore_cluster)"},
-                    "datastore_cluster": {"type": "string", "description": "Datastore cluster (StoragePod) name — picks the datastore with most free space (optional)"},
-                    "network": {"type": "string", "description": "Network name (optional)"},
-                    "thin_provisioned": {"type": "boolean", "description": "Use thin provisioning", "default": True},
-                    "annotation": {"type": "string", "description": "VM annotation/description"},
-                    "folder": {"type": "string", "description": "Target VM folder name (optional)"},
-                    "resource_pool": {"type": "string", "description": "Target resource pool name (optional)"},
-                    "serial_console": {"type": "boolean", "description": "Add a file-backed serial port for console logging", "default": False}
-                },
-                "required": ["name", "cpu", "memory"]
-            }
-        ),
-        "list_templates": types.Tool(
-            name="list_templates",
-            description="List all virtual machine templates",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        "list_datastores": types.Tool(
-            name="list_datastores",
-            description="List all datastores with their details",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        "list_datastore_clusters": types.Tool(
-            name="list_datastore_clusters",
-            description="List all datastore clusters (StoragePods) with their datastores",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        "list_networks": types.Tool(
-            name="list_networks",
-            description="List all networks",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        "list_hosts": types.Tool(
-            name="list_hosts",
-            description="List all ESXi hosts",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        "get_host_details": types.Tool(
-            name="get_host_details",
-            description="Get detailed information about a specific host",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "host_name": {"type": "string", "description": "Name of the host"}
-                },
-                "required": ["host_name"]
-            }
-        ),
-        "get_host_performance_metrics": types.Tool(
-            name="get_host_performance_metrics",
-            description="Get performance metrics for a specific host",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "host_name": {"type": "string", "description": "Name of the host"}
-                },
-                "required": ["host_name"]
-            }
-        ),
-        "get_host_hardware_health": types.Tool(
-            name="get_host_hardware_health",
-            description="Get hardware health information for a specific host",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "host_name": {"type": "string", "description": "Name of the host"}
-                },
-                "required": ["host_name"]
-            }
-        ),
-        "get_host_performance": types.Tool(
-            name="get_host_performance",
-            description="Get detailed performance data for a specific host",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "host_name": {"type": "string", "description": "Name of the host"}
-                },
-                "required": ["host_name"]
-            }
-        ),
-        "list_performance_counters": types.Tool(
-            name="list_performance_counters",
-            description="List all available performance counters",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        "create_snapshot": types.Tool(
-            name="create_snapshot",
-            description="Create a snapshot of a virtual machine",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vm_name": {"type": "string", "description": "Name of the VM"},
-                    "snapshot_name": {"type": "string", "description": "Name for the snapshot"},
-                    "description": {"type": "string", "description": "Snapshot description", "default": ""},
-                    "memory": {"type": "boolean", "description": "Include VM memory in snapshot", "default": False},
-                    "quiesce": {"type": "boolean", "description": "Quiesce guest file system", "default": False}
-                },
-                "required": ["vm_name", "snapshot_name"]
-            }
-        ),
-        "remove_snapshot": types.Tool(
-            name="remove_snapshot",
-            description="Remove a snapshot from a virtual machine",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vm_name": {"type": "string", "description": "Name of the VM"},
-                    "snapshot_name": {"type": "string", "description": "Name of the snapshot to remove"},
-                    "remove_children": {"type": "boolean", "description": "Remove child snapshots", "default": True}
-                },
-                "required": ["vm_name", "snapshot_name"]
-            }
-        ),
-        "revert_snapshot": types.Tool(
-            name="revert_snapshot",
-            description="Revert a virtual machine to a specific snapshot",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vm_name": {"type": "string", "description": "Name of the VM"},
-                    "snapshot_name": {"type": "string", "description": "Name of the snapshot to revert to"}
-                },
-                "required": ["vm_name", "snapshot_name"]
-            }
-        ),
-        "list_snapshots": types.Tool(
-            name="list_snapshots",
-            description="List all snapshots for a virtual machine",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vm_name": {"type": "string", "description": "Name of the VM"}
-                },
-                "required": ["vm_name"]
-            }
-        ),
-        "remove_all_snapshots": types.Tool(
-            name="remove_all_snapshots",
-            description="Remove all snapshots from a virtual machine",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vm_name": {"type": "string", "description": "Name of the VM"}
-                },
-                "required": ["vm_name"]
-            }
-        ),
-        "execute_program_in_vm": types.Tool(
-            name="execute_program_in_vm",
-            description=(
-                "Execute a program inside a VM using VMware Tools. "
-                "If username/password are omitted, authenticates via SAML "
-                "token (requires VMWARE_SAML_ENABLED=true and a guest alias "
-                "configured in the VM)."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vm_name": {"type": "string", "description": "Name of the VM"},
-                    "program_path": {"type": "string", "description": "Full path to the program in guest OS"},
-                    "program_arguments": {"type": "string", "description": "Program arguments (optional)", "default": ""},
-                    "username": {"type": "string", "description": "Guest OS username (optional with SAML)"},
-                    "password": {"type": "string", "description": "Guest OS password (optional with SAML)"}
-                },
-                "required": ["vm_name", "program_path"]
-            }
-        ),
-        "upload_file_to_vm": types.Tool(
-            name="upload_file_to_vm",
-            description=(
-                "Upload a file to a VM using VMware Tools. "
-                "If username/password are omitted, authenticates via SAML."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vm_name": {"type": "string", "description": "Name of the VM"},
-                    "local_file_path": {"type": "string", "description": "Local file path to upload"},
-                    "remote_file_path": {"type": "string", "description": "Destination path in guest OS"},
-                    "username": {"type": "string", "description": "Guest OS username (optional with SAML)"},
-                    "password": {"type": "string", "description": "Guest OS password (optional with SAML)"}
-                },
-                "required": ["vm_name", "local_file_path", "remote_file_path"]
-            }
-        ),
-        "upload_file_to_datastore": types.Tool(
-            name="upload_file_to_datastore",
-            description="Upload a file directly to a datastore",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "datastore_name": {"type": "string", "description": "Name of the datastore"},
-                    "local_file_path": {"type": "string", "description": "Local file path to upload"},
-                    "remote_file_path": {"type": "string", "description": "Destination path on datastore"}
-                },
-                "required": ["datastore_name", "local_file_path", "remote_file_path"]
-            }
-        ),
-        "deploy_ovf": types.Tool(
-            name="deploy_ovf",
-            description="Deploy a VM from OVF and VMDK files",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "ovf_path": {"type": "string", "description": "Path to OVF file"},
-                    "vmdk_path": {"type": "string", "description": "Path to VMDK file"},
-                    "vm_name": {"type": "string", "description": "Name for the new VM (optional)"},
-                    "datastore_name": {"type": "string", "description": "Target datastore (optional)"},
-                    "resource_pool_name": {"type": "string", "description": "Target resource pool (optional)"}
-                },
-                "required": ["ovf_path", "vmdk_path"]
-            }
-        ),
-        "deploy_ova": types.Tool(
-            name="deploy_ova",
-            description="Deploy a VM from an OVA file",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "ova_path": {"type": "string", "description": "Path to OVA file"},
-                    "vm_name": {"type": "string", "description": "Name for the new VM (optional)"},
-                    "datastore_name": {"type": "string", "description": "Target datastore (optional)"},
-                    "resource_pool_name": {"type": "string", "description": "Target resource pool (optional)"}
-                },
-                "required": ["ova_path"]
-            }
-        ),
-        "wait_for_updates": types.Tool(
-            name="wait_for_updates",
-            description="Wait for property updates on vSphere objects",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_type": {"type": "string", "description": "Object type (e.g., 'VirtualMachine', 'Host')"},
-                    "properties": {"type": "array", "items": {"type": "string"}, "description": "Properties to monitor"},
-                    "max_wait_seconds": {"type": "integer", "description": "Max wait time per iteration", "default": 30},
-                    "max_iterations": {"type": "integer", "description": "Max number of iterations", "default": 1}
-                },
-                "required": ["object_type", "properties"]
-            }
-        ),
-        "capture_vm_screenshot": types.Tool(
-            name="capture_vm_screenshot",
-            description=(
-                "Capture the VM console as a PNG screenshot. Returns base64-encoded "
-                "image data. Useful for reading boot output, BIOS screens, or "
-                "generated passwords displayed on the console."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vm_name": {"type": "string", "description": "Name of the VM"}
-                },
-                "required": ["vm_name"]
-            }
-        ),
-        "add_vm_serial_port": types.Tool(
-            name="add_vm_serial_port",
-            description=(
-                "Add a file-backed virtual serial port to a VM. Logs all guest "
-                "console output to a datastore file. The VM should be powered off "
-                "when adding the port, or rebooted afterward."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vm_name": {"type": "string", "description": "Name of the VM"},
-                    "output_file": {
-                        "type": "string",
-                        "description": "Datastore path for the log file. Optional — auto-derived from the VM's datastore path if omitted."
-                    }
-                },
-                "required": ["vm_name"]
-            }
-        ),
-        "read_vm_serial_console": types.Tool(
-            name="read_vm_serial_console",
-            description=(
-                "Read the serial console log for a VM. Returns text output from "
-                "the guest OS serial console. Requires a file-backed serial port "
-                "(see add_vm_serial_port). Use tail_lines for recent output or "
-                "offset_bytes for incremental reads."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vm_name": {"type": "string", "description": "Name of the VM"},
-                    "tail_lines": {
-                        "type": "integer",
-                        "description": "Lines from end of log to return. 0 = everything from offset onward.",
-                        "default": 50
-                    },
-                    "offset_bytes": {
-                        "type": "integer",
-                        "description": "Byte offset for incremental reads.",
-                        "default": 0
-                    }
-                },
-                "required": ["vm_name"]
-            }
-        )
-    }
-    
-    # Map tool names to their handler functions
-    tool_handler_map = {
-        "create_vm": lambda args: tool_handlers.create_vm(**args),
-        "clone_vm": lambda args: tool_handlers.clone_vm(**args),
-        "delete_vm": lambda args: tool_handlers.delete_vm(**args),
-        "power_on_vm": lambda args: tool_handlers.power_on_vm(**args),
-        "power_off_vm": lambda args: tool_handlers.power_off_vm(**args),
-        "list_vms": lambda args: tool_handlers.list_vms(),
-        "get_vm_details": lambda args: tool_handlers.get_vm_details(**args),
-        "get_vm_performance": lambda args: tool_handlers.get_vm_performance(**args),
-        "get_vm_summary_stats": lambda args: tool_handlers.get_vm_summary_stats(**args),
-        "create_vm_custom": lambda args: tool_handlers.create_vm_custom(**args),
-        "list_templates": lambda args: tool_handlers.list_templates(),
-        "list_datastores": lambda args: tool_handlers.list_datastores(),
-        "list_datastore_clusters": lambda args: tool_handlers.list_datastore_clusters(),
-        "list_networks": lambda args: tool_handlers.list_networks(),
-        "list_hosts": lambda args: tool_handlers.list_hosts(),
-        "get_host_details": lambda args: tool_handlers.get_host_details(**args),
-        "get_host_performance_metrics": lambda args: tool_handlers.get_host_performance_metrics(**args),
-        "get_host_hardware_health": lambda args: tool_handlers.get_host_hardware_health(**args),
-        "get_host_performance": lambda args: tool_handlers.get_host_performance(**args),
-        "list_performance_counters": lambda args: tool_handlers.list_performance_counters(),
-        "create_snapshot": lambda args: tool_handlers.create_snapshot(**args),
-        "remove_snapshot": lambda args: tool_handlers.remove_snapshot(**args),
-        "revert_snapshot": lambda args: tool_handlers.revert_snapshot(**args),
-        "list_snapshots": lambda args: tool_handlers.list_snapshots(**args),
-        "remove_all_snapshots": lambda args: tool_handlers.remove_all_snapshots(**args),
-        "execute_program_in_vm": lambda args: tool_handlers.execute_program_in_vm(**args),
-        "upload_file_to_vm": lambda args: tool_handlers.upload_file_to_vm(**args),
-        "upload_file_to_datastore": lambda args: tool_handlers.upload_file_to_datastore(**args),
-        "deploy_ovf": lambda args: tool_handlers.deploy_ovf(**args),
-        "deploy_ova": lambda args: tool_handlers.deploy_ova(**args),
-        "wait_for_updates": lambda args: tool_handlers.wait_for_updates(**args),
-        "capture_vm_screenshot": lambda args: tool_handlers.capture_vm_screenshot(**args),
-        "add_vm_serial_port": lambda args: tool_handlers.add_vm_serial_port(**args),
-        "read_vm_serial_console": lambda args: tool_handlers.read_vm_serial_console(**args),
-    }
-    
-    resources = {
-        "vmStats": types.Resource(
-            name="vmStats",
-            uri="vmstats://{vm_name}",
-            description="Get CPU, memory, storage, network usage of a VM",
-            mimeType="application/json"
-        )
-    }
-    
+    # Indentation roughly doubles the size of large list results, so it can be turned off
+    pretty_json = tool_handlers.config.pretty_json
+
+    # Handlers make blocking pyVmomi SOAP calls; run them on a bounded pool so one
+    # slow vSphere round-trip does not stall the event loop for every other client
+    vsphere_pool = ThreadPoolExecutor(
+        max_workers=tool_handlers.config.vsphere_pool_size,
+        thread_name_prefix="vsphere"
+    )
+    transfer_pool = ThreadPoolExecutor(
+        max_workers=tool_handlers.config.vsphere_pool_size,
+        thread_name_prefix="vsphere-transfer"
+    )
+    wait_pool = ThreadPoolExecutor(
+        max_workers=tool_handlers.config.vsphere_pool_size,
+        thread_name_prefix="vsphere-wait"
+    )
+    # Tools that do not run on vsphere_pool, by name
+    tool_pools = {name: transfer_pool for name in _TRANSFER_TOOLS}
+    tool_pools.update((name, wait_pool) for name in _WAIT_TOOLS)
+
+    # Only listed tools may be dispatched; take their bound methods from the handlers'
+    # dispatch table so a call costs a single dict lookup
+    tool_methods = {name: tool_handlers.dispatch[name] for name in _TOOLS_BY_NAME}
+
     # Register tool handlers using decorators
     @mcp_server.list_tools()
     async def list_tools_handler():
         """List all available tools."""
-        return list(tools.values())
+        return _LIST_TOOLS_RESULT
     
-    @mcp_server.call_tool()
+    # Arguments are checked with the precompiled validators below instead of the
+    # framework's per-call jsonschema validation
+    @mcp_server.call_tool(validate_input=False)
     async def call_tool_handler(name: str, arguments: dict):
         """Handle tool calls."""
-        if name not in tool_handler_map:
-            raise ValueError(f"Unknown tool: {name}")
+        try:
+            method = tool_methods[name]
+        except KeyError:
+            raise ValueError(f"Unknown tool: {name}") from None
+        
+        try:
+            _TOOL_VALIDATORS[name](arguments)
+        except fastjsonschema.JsonSchemaValueException as e:
+            raise ValueError(f"Input validation error: {e.message}") from None
         
-        # Call the handler function
-        handler = tool_handler_map[name]
-        result = handler(arguments)
+        # Zero-argument tools skip the keyword unpack
+        loop = asyncio.get_running_loop()
+        pool = tool_pools.get(name, vsphere_pool)
+        if arguments:
+            result = await loop.run_in_executor(pool, functools.partial(method, **arguments))
+        else:
+            result = await loop.run_in_executor(pool, method)
         
         # Return screenshot as ImageContent so AI agents can interpret the image directly
         if name == "capture_vm_screenshot" and isinstance(result, dict) and "image_base64" in result:
@@ -510,37 +148,37 @@ def register_handlers(mcp_server: Server, tool_handlers: ToolHandlers):
                 )]
             except Exception:
                 # Fall back to text if ImageContent is not supported
-                return [types.TextContent(type="text", text=result["image_base64"])]
+                return [_text(result["image_base64"])]
 
-        # Return result as text content
+        # Return result as text content; handlers may already return serialized JSON text
         if isinstance(result, (dict, list)):
-            text = json.dumps(result, indent=2)
+            text = jsonlib.dumps(result, pretty_json)
         else:
             text = str(result)
 
-        return [types.TextContent(type="text", text=text)]
+        return [_text(text)]
     
     # Register resource handlers
     @mcp_server.list_resources()
     async def list_resources_handler():
         """List all available resources."""
-        return list(resources.values())
+        return _RESOURCES_LIST
+    
+    # Map resource names to readers taking the URI parameter (e.g. vm_name for vmstats://{vm_name})
+    resource_readers = {
+        "vmStats": tool_handlers.vm_performance_resource,
+    }
     
     @mcp_server.read_resource()
     async def read_resource_handler(uri: str):
         """Handle resource reads."""
-        # Parse URI to extract resource name and parameters
-        for resource_name, resource in resources.items():
-            if uri.startswith(resource.uri.split("{")[0]):
-                # Extract parameters from URI
-                # For vmstats://{vm_name}, extract vm_name
-                if resource_name == "vmStats":
-                    vm_name = uri.replace("vmstats://", "")
-                    result = tool_handlers.vm_performance_resource(vm_name)
-                    # Return resource content
-                    return [types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2)
-                    )]
+        uri = str(uri)
+        for prefix, resource_name in _RESOURCE_PREFIXES:
+            if uri.startswith(prefix):
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(
+                    vsphere_pool, resource_readers[resource_name], uri.removeprefix(prefix))
+                # Return resource content
+                return [_text(jsonlib.dumps(result, pretty_json))]
         
         raise ValueError(f"Unknown resource: {uri}")
@@ -0,0 +1,49 @@
+"""Lightweight result records returned by list-style VMware operations."""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+# Records are frozen and slotted: one is built per inventory object, and orjson
+# serializes dataclasses directly into the same JSON objects the dicts used to produce
+
+@dataclass(frozen=True, slots=True)
+class DatastoreInfo:
+    """Summary of a datastore."""
+    name: str
+    type: str
+    capacity_gb: float
+    free_space_gb: float
+    accessible: bool
+    maintenance_mode: str
+
+
+@dataclass(frozen=True, slots=True)
+class DatastoreClusterInfo:
+    """Summary of a datastore cluster (StoragePod)."""
+    name: str
+    capacity_gb: float
+    free_space_gb: float
+    datastores: List[str]
+
+
+@dataclass(frozen=True, slots=True)
+class PerformanceCounterInfo:
+    """Description of a vSphere performance counter."""
+    key: int
+    group: str
+    name: str
+    rollup_type: str
+    stats_type: str
+    unit: str
+    description: str
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotInfo:
+    """A snapshot in a VM's snapshot tree; level is its depth below the root."""
+    name: str
+    description: Optional[str]
+    create_time: str
+    state: str
+    level: int
@@ -1,71 +1,397 @@
 """MCP tool handler functions."""
 
+import collections
+import contextlib
+import functools
 import logging
-from typing import Optional
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Optional
 
-from .vmware_manager import VMwareManager
+from cachetools import TTLCache
+
+from . import jsonlib
+from .vmware_manager import VMwareManager, ObjectNotFound
 from .config import Config
 
 
+# VMwareManager methods the handlers forward to; each is bound once per ToolHandlers
+# as self._m_<name> so a call skips the self.manager attribute lookup
+_MANAGER_METHODS = (
+    "create_vm", "clone_vm", "delete_vm", "power_on_vm", "power_off_vm", "list_vms",
+    "get_vm_details", "get_vms_details_batch", "get_vm_performance", "get_vms_performance_batch",
+    "get_vm_summary_stats", "create_vm_custom", "capture_vm_screenshot",
+    "add_vm_serial_port", "add_vm_disks", "read_vm_serial_console", "list_templates", "list_datastores",
+    "list_datastore_clusters", "list_networks", "list_hosts", "get_host_details",
+    "get_hosts_details_batch", "get_host_performance_metrics",
+    "get_host_hardware_health", "get_host_performance", "list_performance_counters",
+    "create_snapshot", "remove_snapshot", "revert_snapshot", "list_snapshots",
+    "remove_all_snapshots", "join_tasks", "execute_program_in_vm", "upload_file_to_vm",
+    "upload_file_to_datastore", "deploy_ovf", "deploy_ova", "wait_for_updates"
+)
+
+
+# Message of the PermissionError raised for every rejected call
+_UNAUTHORIZED_MSG = "Unauthorized: API key required."
+
+
+class NoAuth:
+    """Auth strategy used when no API key is configured: every call is allowed."""
+    __slots__ = ()
+    
+    def check(self):
+        pass
+
+
+class KeyAuth:
+    """Auth strategy used when an API key is configured: calls require manager.authenticated."""
+    __slots__ = ("manager",)
+    
+    def __init__(self, manager: VMwareManager):
+        self.manager = manager
+    
+    def check(self):
+        if not self.manager.authenticated:
+            raise PermissionError(_UNAUTHORIZED_MSG)
+
+
+def _requires_auth(method):
+    """Wrap a handler method so it is refused until the API key has been verified."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._auth.check()
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _cached(method):
+    """
+    Serve repeated read-only calls with the same arguments from the inventory cache.
+    
+    Concurrent calls with the same arguments share a single in-flight vCenter call.
+    """
+    name = method.__name__
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (name, args, tuple(sorted(kwargs.items())))
+        with self._cache_lock:
+            if self._cache is not None:
+                try:
+                    return self._cache[key]
+                except KeyError:
+                    pass
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+                generation = self._cache_generation
+        if not leader:
+            return future.result()
+        
+        try:
+            result = method(self, *args, **kwargs)
+        except BaseException as e:
+            with self._cache_lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+            future.set_exception(e)
+            raise
+        with self._cache_lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            # Skip storing if a mutating call invalidated the cache meanwhile
+            if self._cache is not None and generation == self._cache_generation:
+                self._cache[key] = result
+        future.set_result(result)
+        return result
+    return wrapper
+
+
+def _remembers_not_found(method):
+    """Answer repeated lookups of a missing object from memory for a few seconds."""
+    name = method.__name__
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (name, args, tuple(sorted(kwargs.items())))
+        with self._cache_lock:
+            message = self._not_found.get(key)
+            generation = self._cache_generation
+        if message is not None:
+            raise ObjectNotFound(message)
+        try:
+            return method(self, *args, **kwargs)
+        except ObjectNotFound as e:
+            with self._cache_lock:
+                if generation == self._cache_generation:
+                    self._not_found[key] = str(e)
+            raise
+    return wrapper
+
+
+def _returns_json(method):
+    """Return the handler's result as JSON text, so cache hits skip re-encoding it."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return jsonlib.dumps(method(self, *args, **kwargs), self.config.pretty_json)
+    return wrapper
+
+
+def _invalidates_cache(method):
+    """Clear the inventory cache after a call that changes vCenter state."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            # Also on failure, since the operation may have partially applied
+            self.invalidate_cache()
+    return wrapper
+
+
 class ToolHandlers:
     """Container for MCP tool handler functions."""
     
+    __slots__ = (
+        "manager", "config", "dispatch", "_auth",
+        "_cache", "_not_found", "_cache_lock", "_cache_generation", "_inflight",
+        "_task_pool", "_pending_tasks", "_finished_tasks", "_pending_tasks_lock",
+        "_provisioning_ops", "_perf_counters_cache",
+    ) + tuple(f"_m_{name}" for name in _MANAGER_METHODS)
+    
     def __init__(self, manager: VMwareManager, config: Config):
         self.manager = manager
         self.config = config
-    
-    def _check_auth(self):
-        """Internal helper: Check API access permissions."""
-        if self.config.api_key:
-            # If an API key is configured, require that manager.authenticated is True
-            if not self.manager.authenticated:
-                raise Exception("Unauthorized: API key required.")
-    
+        for name in _MANAGER_METHODS:
+            setattr(self, f"_m_{name}", getattr(manager, name))
+        # The API key setting is fixed for the process lifetime, so pick the strategy once
+        self._auth = KeyAuth(manager) if config.api_key else NoAuth()
+        # Short-lived cache of read-only inventory results, keyed on (method, args)
+        self._cache = TTLCache(maxsize=1024, ttl=config.inventory_ttl) if config.inventory_ttl > 0 else None
+        # Recent not-found lookups, so repeated queries for a missing name skip vCenter
+        self._not_found = TTLCache(maxsize=1024, ttl=10)
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
+        # Futures of cached reads currently running, keyed like the cache
+        self._inflight = {}
+        # Background provisioning jobs started by the *_async tools, keyed by task id
+        self._task_pool = ThreadPoolExecutor(
+            max_workers=config.vsphere_pool_size,
+            thread_name_prefix="vsphere-task"
+        )
+        self._pending_tasks = {}
+        # Finished jobs until their outcome is read, or for an hour if it never is
+        self._finished_tasks = TTLCache(maxsize=1024, ttl=3600)
+        self._pending_tasks_lock = threading.Lock()
+        # Cap on concurrent provisioning calls for bulk_create_vms and bulk_delete_vms; power
+        # and snapshot tasks are capped per host and overall by the manager as they start
+        self._provisioning_ops = threading.BoundedSemaphore(8)
+        # (connection epoch, counters JSON): the counter catalog is fixed for a vCenter session
+        self._perf_counters_cache = None
+        # Bound handler methods by tool name, resolved once
+        self.dispatch = {name: getattr(self, name) for name in PUBLIC_TOOLS}
+    
+    def handle(self, tool_name: str, **kwargs):
+        """Call the handler method for tool_name with the given arguments."""
+        try:
+            method = self.dispatch[tool_name]
+        except KeyError:
+            raise ValueError(f"Unknown tool: {tool_name}") from None
+        return method(**kwargs)
+    
+    def invalidate_cache(self):
+        """Drop all cached inventory results, including remembered not-found lookups."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            if self._cache is not None:
+                self._cache.clear()
+            self._not_found.clear()
+            # Reads already running may predate the change; later callers start their own
+            self._inflight.clear()
+    
+    def _start_task(self, method, kwargs: dict) -> dict:
+        """Run a long-running handler in the background and return its task id."""
+        task_id = uuid.uuid4().hex
+        future = self._task_pool.submit(functools.partial(method, **kwargs))
+        with self._pending_tasks_lock:
+            self._pending_tasks[task_id] = future
+        future.add_done_callback(functools.partial(self._finish_task, task_id))
+        logging.info(f"Started background task {task_id} for {method.__name__}")
+        return {"task_id": task_id}
+    
+    def _finish_task(self, task_id: str, future: Future):
+        """Move a finished background job to the retention cache, so unread outcomes expire."""
+        with self._pending_tasks_lock:
+            if self._pending_tasks.pop(task_id, None) is not None:
+                self._finished_tasks[task_id] = future
+    
+    def wait_for_task(self, task_id: str, timeout: int = 300) -> dict:
+        """Wait for a task started by one of the *_async tools and return its outcome."""
+        with self._pending_tasks_lock:
+            future = self._pending_tasks.get(task_id) or self._finished_tasks.get(task_id)
+        if future is None:
+            raise ValueError(f"Unknown task: {task_id}")
+        try:
+            result = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            return {"task_id": task_id, "status": "running"}
+        except Exception as e:
+            outcome = {"task_id": task_id, "status": "error", "error": str(e)}
+        else:
+            outcome = {"task_id": task_id, "status": "success", "result": result}
+        # A finished task's outcome is reported once
+        with self._pending_tasks_lock:
+            self._pending_tasks.pop(task_id, None)
+            self._finished_tasks.pop(task_id, None)
+        return outcome
+    
+    def poll_task(self, task_id: str) -> dict:
+        """Return the status of a task started by one of the *_async tools without waiting."""
+        return self.wait_for_task(task_id, timeout=0)
+    
+    def create_vm_async(self, **kwargs) -> dict:
+        """Start create_vm in the background."""
+        return self._start_task(self.create_vm, kwargs)
+    
+    def clone_vm_async(self, **kwargs) -> dict:
+        """Start clone_vm in the background."""
+        return self._start_task(self.clone_vm, kwargs)
+    
+    def create_vm_custom_async(self, **kwargs) -> dict:
+        """Start create_vm_custom in the background."""
+        return self._start_task(self.create_vm_custom, kwargs)
+    
+    def upload_file_to_vm_async(self, **kwargs) -> dict:
+        """Start upload_file_to_vm in the background."""
+        return self._start_task(self.upload_file_to_vm, kwargs)
+    
+    def upload_file_to_datastore_async(self, **kwargs) -> dict:
+        """Start upload_file_to_datastore in the background."""
+        return self._start_task(self.upload_file_to_datastore, kwargs)
+    
+    def deploy_ovf_async(self, **kwargs) -> dict:
+        """Start deploy_ovf in the background."""
+        return self._start_task(self.deploy_ovf, kwargs)
+    
+    def deploy_ova_async(self, **kwargs) -> dict:
+        """Start deploy_ova in the background."""
+        return self._start_task(self.deploy_ova, kwargs)
+    
+    def _run_bulk(self, method: Callable, items: list, key: Callable, semaphore=None) -> dict:
+        """
+        Run method once per item concurrently and collect per-item outcomes.
+        
+        Args:
+            method: Handler called with each item as keyword arguments (dict) or single argument
+            items: Names or argument dicts to process
+            key: Function returning the result key (e.g. the VM name) for an item
+            semaphore: Limits how many calls of this operation class run at once, if given
+            
+        Raises:
+            ValueError: If two items have the same key
+        """
+        limit = semaphore if semaphore is not None else contextlib.nullcontext()
+        
+        def run_one(item):
+            with limit:
+                if isinstance(item, dict):
+                    return method(**item)
+                return method(item)
+        
+        results = {}
+        if not items:
+            return results
+        keys = [key(item) for item in items]
+        # Outcomes are reported per key, so a repeated key would hide one of them
+        duplicates = sorted(str(item_key) for item_key, count in collections.Counter(keys).items() if count > 1)
+        if duplicates:
+            raise ValueError(f"Duplicate entries: {', '.join(duplicates)}")
+        with ThreadPoolExecutor(max_workers=min(len(items), 32), thread_name_prefix="vsphere-bulk") as pool:
+            futures = [(item_key, pool.submit(run_one, item)) for item_key, item in zip(keys, items)]
+            for item_key, future in futures:
+                try:
+                    results[item_key] = {"status": "success", "result": future.result()}
+                except Exception as e:
+                    results[item_key] = {"status": "error", "error": str(e)}
+        return results
+    
+    def bulk_create_vms(self, specs: list) -> dict:
+        """Create several virtual machines concurrently from create_vm argument objects."""
+        return self._run_bulk(self.create_vm, specs, lambda spec: spec.get("name"), self._provisioning_ops)
+    
+    def bulk_delete_vms(self, names: list) -> dict:
+        """Delete several virtual machines concurrently."""
+        return self._run_bulk(self.delete_vm, names, str, self._provisioning_ops)
+    
+    def bulk_power_on_vms(self, names: list) -> dict:
+        """Power on several virtual machines concurrently."""
+        return self._run_bulk(self.power_on_vm, names, str)
+    
+    def bulk_power_off_vms(self, names: list) -> dict:
+        """Power off several virtual machines concurrently."""
+        return self._run_bulk(self.power_off_vm, names, str)
+    
+    def bulk_create_snapshots(self, names: list, snapshot_name: str, description: str = "",
+                              memory: bool = False, quiesce: bool = False) -> dict:
+        """Create a snapshot with the same name on several virtual machines concurrently."""
+        create = functools.partial(self.create_snapshot, snapshot_name=snapshot_name,
+                                   description=description, memory=memory, quiesce=quiesce)
+        return self._run_bulk(create, names, str)
+    
+    @_invalidates_cache
     def create_vm(self, name: str, cpu: int, memory: int, datastore: Optional[str] = None, network: Optional[str] = None, folder: Optional[str] = None, resource_pool: Optional[str] = None, serial_console: bool = False, datastore_cluster: Optional[str] = None) -> str:
         """Create a new virtual machine."""
-        self._check_auth()
-        return self.manager.create_vm(name, cpu, memory, datastore, network, folder, resource_pool, serial_console, datastore_cluster)
+        return self._m_create_vm(name, cpu, memory, datastore, network, folder, resource_pool, serial_console, datastore_cluster)
 
+    @_invalidates_cache
     def clone_vm(self, template_name: str, new_name: str, folder: Optional[str] = None, resource_pool: Optional[str] = None, datastore: Optional[str] = None, datastore_cluster: Optional[str] = None) -> str:
         """Clone a virtual machine from a template."""
-        self._check_auth()
-        return self.manager.clone_vm(template_name, new_name, folder, resource_pool, datastore, datastore_cluster)
+        return self._m_clone_vm(template_name, new_name, folder, resource_pool, datastore, datastore_cluster)
     
+    @_invalidates_cache
     def delete_vm(self, name: str) -> str:
         """Delete the specified virtual machine."""
-        self._check_auth()
-        return self.manager.delete_vm(name)
+        return self._m_delete_vm(name)
     
-    def power_on_vm(self, name: str) -> str:
+    @_invalidates_cache
+    def power_on_vm(self, name: str, wait: bool = True) -> str:
         """Power on the specified virtual machine."""
-        self._check_auth()
-        return self.manager.power_on_vm(name)
+        return self._m_power_on_vm(name, wait)
     
-    def power_off_vm(self, name: str) -> str:
+    @_invalidates_cache
+    def power_off_vm(self, name: str, wait: bool = True) -> str:
         """Power off the specified virtual machine."""
-        self._check_auth()
-        return self.manager.power_off_vm(name)
+        return self._m_power_off_vm(name, wait)
+    
+    @_invalidates_cache
+    def join_vcenter_tasks(self, task_ids: list, timeout: int = 300) -> dict:
+        """Wait for several vCenter tasks, such as power operations started with wait=false."""
+        return self._m_join_tasks(task_ids, timeout)
     
+    @_cached
     def list_vms(self) -> list:
         """Return a list of all virtual machine names."""
-        self._check_auth()
-        return self.manager.list_vms()
+        return self._m_list_vms()
     
+    @_remembers_not_found
+    @_cached
     def get_vm_details(self, vm_name: str) -> dict:
         """Get detailed information about a virtual machine."""
-        self._check_auth()
-        return self.manager.get_vm_details(vm_name)
+        return self._m_get_vm_details(vm_name)
     
-    def get_vm_performance(self, vm_name: str) -> dict:
-        """Get performance data for a virtual machine."""
-        self._check_auth()
-        return self.manager.get_vm_performance(vm_name)
+    @_cached
+    @_returns_json
+    def get_vm_performance(self, vm_name: str) -> str:
+        """Get performance data for a virtual machine as JSON text."""
+        return self._m_get_vm_performance(vm_name)
     
-    def get_vm_summary_stats(self, vm_name: str) -> dict:
-        """Get summary statistics for a virtual machine."""
-        self._check_auth()
-        return self.manager.get_vm_summary_stats(vm_name)
+    @_cached
+    @_returns_json
+    def get_vm_summary_stats(self, vm_name: str) -> str:
+        """Get summary statistics for a virtual machine as JSON text."""
+        return self._m_get_vm_summary_stats(vm_name)
     
+    @_invalidates_cache
     def create_vm_custom(self, name: str, cpu: int, memory: int, disk_size_gb: int = 10,
                         guest_id: str = "otherGuest", datastore: Optional[str] = None,
                         network: Optional[str] = None, thin_provisioned: bool = True,
@@ -73,148 +399,180 @@ class ToolHandlers:
                         resource_pool: Optional[str] = None, serial_console: bool = False,
                         datastore_cluster: Optional[str] = None) -> str:
         """Create a custom virtual machine with advanced options."""
-        self._check_auth()
-        return self.manager.create_vm_custom(name, cpu, memory, disk_size_gb, guest_id,
+        return self._m_create_vm_custom(name, cpu, memory, disk_size_gb, guest_id,
                                             datastore, network, thin_provisioned, annotation, folder, resource_pool, serial_console, datastore_cluster)
 
-    def capture_vm_screenshot(self, vm_name: str) -> dict:
-        """Capture a screenshot of the VM console."""
-        self._check_auth()
-        return self.manager.capture_vm_screenshot(vm_name)
-
+    @_invalidates_cache
     def add_vm_serial_port(self, vm_name: str, output_file: str = None) -> str:
         """Add a file-backed serial port to a VM."""
-        self._check_auth()
-        return self.manager.add_vm_serial_port(vm_name, output_file)
+        return self._m_add_vm_serial_port(vm_name, output_file)
 
-    def read_vm_serial_console(self, vm_name: str, tail_lines: int = 50,
-                               offset_bytes: int = 0) -> dict:
-        """Read the serial console log for a VM."""
-        self._check_auth()
-        return self.manager.read_vm_serial_console(vm_name, tail_lines, offset_bytes)
-    
+    @_invalidates_cache
+    def add_vm_disks(self, vm_name: str, disk_sizes_gb: list, thin_provisioned: bool = True) -> str:
+        """Add several new virtual disks to a VM in one reconfigure task."""
+        return self._m_add_vm_disks(vm_name, disk_sizes_gb, thin_provisioned)
+
+    @_cached
     def list_templates(self) -> list:
         """List all virtual machine templates."""
-        self._check_auth()
-        return self.manager.list_templates()
+        return self._m_list_templates()
     
+    @_cached
     def list_datastores(self) -> list:
         """List all datastores."""
-        self._check_auth()
-        return self.manager.list_datastores()
+        return self._m_list_datastores()
     
+    @_cached
     def list_datastore_clusters(self) -> list:
         """List all datastore clusters (StoragePods)."""
-        self._check_auth()
-        return self.manager.list_datastore_clusters()
+        return self._m_list_datastore_clusters()
     
+    @_cached
     def list_networks(self) -> list:
         """List all networks."""
-        self._check_auth()
-        return self.manager.list_networks()
+        return self._m_list_networks()
     
+    @_cached
     def list_hosts(self) -> list:
         """List all ESXi hosts."""
-        self._check_auth()
-        return self.manager.list_hosts()
+        return self._m_list_hosts()
     
+    @_remembers_not_found
+    @_cached
     def get_host_details(self, host_name: str) -> dict:
         """Get detailed information about a host."""
-        self._check_auth()
-        return self.manager.get_host_details(host_name)
-    
-    def get_host_performance_metrics(self, host_name: str) -> dict:
-        """Get performance metrics for a host."""
-        self._check_auth()
-        return self.manager.get_host_performance_metrics(host_name)
-    
-    def get_host_hardware_health(self, host_name: str) -> dict:
-        """Get hardware health information for a host."""
-        self._check_auth()
-        return self.manager.get_host_hardware_health(host_name)
-    
-    def get_host_performance(self, host_name: str) -> dict:
-        """Get detailed performance data for a host."""
-        self._check_auth()
-        return self.manager.get_host_performance(host_name)
-    
-    def list_performance_counters(self) -> list:
-        """List all available performance counters."""
-        self._check_auth()
-        return self.manager.list_performance_counters()
-    
+        return self._m_get_host_details(host_name)
+    
+    @_cached
+    @_returns_json
+    def get_host_performance_metrics(self, host_name: str) -> str:
+        """Get performance metrics for a host as JSON text."""
+        return self._m_get_host_performance_metrics(host_name)
+    
+    def list_performance_counters(self) -> str:
+        """List all available performance counters as JSON text."""
+        epoch = self.manager.connection_epoch
+        cached = self._perf_counters_cache
+        if cached is not None and cached[0] == epoch:
+            return cached[1]
+        counters = jsonlib.dumps(self._m_list_performance_counters(), self.config.pretty_json)
+        # Tagged with the epoch seen before the call, so a reconnect during it forces one re-encode
+        self._perf_counters_cache = (epoch, counters)
+        return counters
+    
+    @_invalidates_cache
     def create_snapshot(self, vm_name: str, snapshot_name: str, description: str = "",
                        memory: bool = False, quiesce: bool = False) -> str:
         """Create a snapshot of a virtual machine."""
-        self._check_auth()
-        return self.manager.create_snapshot(vm_name, snapshot_name, description, memory, quiesce)
+        return self._m_create_snapshot(vm_name, snapshot_name, description, memory, quiesce)
     
+    @_invalidates_cache
     def remove_snapshot(self, vm_name: str, snapshot_name: str, remove_children: bool = True) -> str:
         """Remove a snapshot from a virtual machine."""
-        self._check_auth()
-        return self.manager.remove_snapshot(vm_name, snapshot_name, remove_children)
+        return self._m_remove_snapshot(vm_name, snapshot_name, remove_children)
     
+    @_invalidates_cache
     def revert_snapshot(self, vm_name: str, snapshot_name: str) -> str:
         """Revert a virtual machine to a specific snapshot."""
-        self._check_auth()
-        return self.manager.revert_snapshot(vm_name, snapshot_name)
-    
-    def list_snapshots(self, vm_name: str) -> list:
-        """List all snapshots for a virtual machine."""
-        self._check_auth()
-        return self.manager.list_snapshots(vm_name)
+        return self._m_revert_snapshot(vm_name, snapshot_name)
     
+    @_invalidates_cache
     def remove_all_snapshots(self, vm_name: str) -> str:
         """Remove all snapshots from a virtual machine."""
-        self._check_auth()
-        return self.manager.remove_all_snapshots(vm_name)
-    
-    def execute_program_in_vm(self, vm_name: str, program_path: str,
-                             program_arguments: str = "",
-                             username: str = None,
-                             password: str = None) -> dict:
-        """Execute a program inside a VM."""
-        self._check_auth()
-        return self.manager.execute_program_in_vm(
-            vm_name, program_path, program_arguments, username, password)
-
-    def upload_file_to_vm(self, vm_name: str, local_file_path: str,
-                         remote_file_path: str,
-                         username: str = None,
-                         password: str = None) -> str:
-        """Upload a file to a VM."""
-        self._check_auth()
-        return self.manager.upload_file_to_vm(
-            vm_name, local_file_path, remote_file_path, username, password)
+        return self._m_remove_all_snapshots(vm_name)
     
+    @_invalidates_cache
     def upload_file_to_datastore(self, datastore_name: str, local_file_path: str,
                                  remote_file_path: str) -> str:
         """Upload a file to a datastore."""
-        self._check_auth()
-        return self.manager.upload_file_to_datastore(datastore_name, local_file_path,
+        return self._m_upload_file_to_datastore(datastore_name, local_file_path,
                                                      remote_file_path)
     
+    @_invalidates_cache
     def deploy_ovf(self, ovf_path: str, vmdk_path: str, vm_name: str = None,
                    datastore_name: str = None, resource_pool_name: str = None) -> str:
         """Deploy a VM from OVF and VMDK files."""
-        self._check_auth()
-        return self.manager.deploy_ovf(ovf_path, vmdk_path, vm_name,
+        return self._m_deploy_ovf(ovf_path, vmdk_path, vm_name,
                                       datastore_name, resource_pool_name)
     
+    @_invalidates_cache
     def deploy_ova(self, ova_path: str, vm_name: str = None,
                    datastore_name: str = None, resource_pool_name: str = None) -> str:
         """Deploy a VM from an OVA file."""
-        self._check_auth()
-        return self.manager.deploy_ova(ova_path, vm_name, datastore_name, resource_pool_name)
-    
-    def wait_for_updates(self, object_type: str, properties: list,
-                        max_wait_seconds: int = 30, max_iterations: int = 1) -> dict:
-        """Wait for property updates on vSphere objects."""
-        self._check_auth()
-        return self.manager.wait_for_updates(object_type, properties,
-                                            max_wait_seconds, max_iterations)
-    
-    def vm_performance_resource(self, vm_name: str) -> dict:
-        """Retrieve CPU, memory, storage, and network usage for the specified virtual machine."""
-        self._check_auth()
-        return self.manager.get_vm_performance(vm_name)
+        return self._m_deploy_ova(ova_path, vm_name, datastore_name, resource_pool_name)
+    
+
+# Handlers that only check auth and forward to the manager, generated below:
+# (tool name, parameters, manager method, docstring)
+_FORWARDING_HANDLERS = (
+    ("get_vms_details_batch", "vm_names: list", "get_vms_details_batch",
+     "Get detailed information about several virtual machines at once."),
+    ("get_vms_performance_batch", "vm_names: list", "get_vms_performance_batch",
+     "Get performance data for several virtual machines at once."),
+    ("capture_vm_screenshot", "vm_name: str", "capture_vm_screenshot",
+     "Capture a screenshot of the VM console."),
+    ("read_vm_serial_console", "vm_name: str, tail_lines: int = 50, offset_bytes: int = 0", "read_vm_serial_console",
+     "Read the serial console log for a VM."),
+    ("get_hosts_details_batch", "host_names: list", "get_hosts_details_batch",
+     "Get detailed information about several hosts at once."),
+    ("get_host_hardware_health", "host_name: str", "get_host_hardware_health",
+     "Get hardware health information for a host."),
+    ("get_host_performance", "host_name: str", "get_host_performance",
+     "Get detailed performance data for a host."),
+    ("list_snapshots", "vm_name: str", "list_snapshots",
+     "List all snapshots for a virtual machine."),
+    ("execute_program_in_vm",
+     "vm_name: str, program_path: str, program_arguments: str = \"\", username: str = None, password: str = None",
+     "execute_program_in_vm", "Execute a program inside a VM."),
+    ("upload_file_to_vm",
+     "vm_name: str, local_file_path: str, remote_file_path: str, username: str = None, password: str = None",
+     "upload_file_to_vm", "Upload a file to a VM."),
+    ("wait_for_updates",
+     "object_type: str, properties: list, max_wait_seconds: int = 30, max_iterations: int = 1, "
+     "version: Optional[str] = None",
+     "wait_for_updates", "Wait for property updates on vSphere objects."),
+    ("vm_performance_resource", "vm_name: str", "get_vm_performance",
+     "Retrieve CPU, memory, storage, and network usage for the specified virtual machine."),
+)
+
+
+def _make_forwarding_handler(name: str, params: str, target: str, doc: str):
+    """
+    Compile a handler that checks auth inline and calls the pre-bound manager method.
+    
+    The generated body is just the check and one call, so these handlers skip both
+    the hand-written wrapper frame and the _requires_auth frame.
+    """
+    arg_names = [param.split(":")[0].split("=")[0].strip() for param in params.split(",")]
+    source = (
+        f"def {name}(self, {params}):\n"
+        f"    self._auth.check()\n"
+        f"    return self._m_{target}({', '.join(arg_names)})\n"
+    )
+    namespace = {"Optional": Optional}
+    exec(compile(source, f"<ToolHandlers.{name}>", "exec"), namespace)
+    handler = namespace[name]
+    handler.__doc__ = doc
+    handler.__qualname__ = f"ToolHandlers.{name}"
+    handler.__module__ = __name__
+    handler._checks_auth = True
+    return handler
+
+
+for _spec in _FORWARDING_HANDLERS:
+    setattr(ToolHandlers, _spec[0], _make_forwarding_handler(*_spec))
+del _spec
+
+# Public methods that are not tool handlers
+_NON_TOOL_METHODS = frozenset({"handle", "invalidate_cache"})
+
+# Every public handler requires auth; wrap them once here instead of checking inline
+PUBLIC_TOOLS = frozenset(
+    name for name, attr in vars(ToolHandlers).items()
+    if not name.startswith("_") and callable(attr) and name not in _NON_TOOL_METHODS
+)
+for _name in PUBLIC_TOOLS:
+    _method = getattr(ToolHandlers, _name)
+    if not getattr(_method, "_checks_auth", False):
+        setattr(ToolHandlers, _name, _requires_auth(_method))
+del _name, _method
@@ -1,9 +1,12 @@
 """Transport layer for MCP server (HTTP and stdio)."""
 
 import asyncio
+import hashlib
+import hmac
 import logging
 from typing import Optional
 
+from mcp.server.models import InitializationOptions
 from mcp.server.streamable_http import StreamableHTTPServerTransport
 
 from .config import Config
@@ -15,7 +18,13 @@ streamable_http_task: Optional[asyncio.Task] = None
 streamable_http_lock = asyncio.Lock()
 
 
-async def streamable_http_endpoint(scope, receive, send, mcp_server, config: Config):
+def _hash_key(key: str) -> bytes:
+    """Return the SHA-256 digest used to compare API keys."""
+    return hashlib.sha256(key.encode("utf-8")).digest()
+
+
+async def streamable_http_endpoint(scope, receive, send, mcp_server, config: Config,
+                                   init_opts: InitializationOptions, api_key_hash: Optional[bytes]):
     """Handle streamable-http MCP requests."""
     global streamable_http_transport, streamable_http_task
     
@@ -34,7 +43,9 @@ async def streamable_http_endpoint(scope, receive, send, mcp_server, config: Con
     elif "x-api-key" in headers_dict:
         provided_key = headers_dict.get("x-api-key", "").strip()
     
-    if config.api_key and provided_key != config.api_key:
+    # Compare fixed-length digests in constant time; the configured key is hashed once at startup
+    if api_key_hash is not None and (
+            provided_key is None or not hmac.compare_digest(_hash_key(provided_key), api_key_hash)):
         # If the correct API key is not provided, return 401
         await send({"type": "http.response.start", "status": 401, "headers": [(b"content-type", b"text/plain")]})
         await send({"type": "http.response.body", "body": b"Unauthorized"})
@@ -57,7 +68,6 @@ async def streamable_http_endpoint(scope, receive, send, mcp_server, config: Con
             async def run_mcp_server():
                 try:
                     async with streamable_http_transport.connect() as (read_stream, write_stream):
-                        init_opts = mcp_server.create_initialization_options()
                         logging.info("Starting MCP server with streamable-http transport")
                         await mcp_server.run(read_stream, write_stream, init_opts)
                 except asyncio.CancelledError:
@@ -85,12 +95,23 @@ async def streamable_http_endpoint(scope, receive, send, mcp_server, config: Con
             pass
 
 
-async def create_asgi_app(mcp_server, config: Config):
+def create_asgi_app(mcp_server, config: Config, init_opts: Optional[InitializationOptions] = None):
     """
     Create ASGI application routing.
     
     Dispatch requests to the appropriate handler based on the path and method.
+    Construction is synchronous so that no event loop is needed before uvicorn
+    starts its own; background tasks are only created from within that loop.
+    
+    Args:
+        mcp_server: The MCP Server instance
+        config: Server configuration
+        init_opts: Prebuilt initialization options (created from mcp_server if omitted)
     """
+    if init_opts is None:
+        init_opts = mcp_server.create_initialization_options()
+    api_key_hash = _hash_key(config.api_key) if config.api_key else None
+    
     async def app(scope, receive, send):
         if scope["type"] == "http":
             path = scope.get("path", "")
@@ -107,7 +128,8 @@ async def create_asgi_app(mcp_server, config: Config):
                     await send({"type": "http.response.start", "status": 204, "headers": headers})
                     await send({"type": "http.response.body", "body": b""})
                 else:
-                    await streamable_http_endpoint(scope, receive, send, mcp_server, config)
+                    await streamable_http_endpoint(scope, receive, send, mcp_server, config, init_opts,
+                                                   api_key_hash)
             else:
                 # Route not found
                 await send({"type": "http.response.start", "status": 404,
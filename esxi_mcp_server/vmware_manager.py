@@ -1,16 +1,271 @@
 """VMware vSphere management using pyVmomi."""
 
+import os
 import re
 import ssl
 import time
 import base64
 import logging
-from typing import Optional, Dict, Any
+import tarfile
+import threading
+import itertools
+import subprocess
+import collections
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone, timedelta
+from urllib.parse import quote
+from urllib.request import Request, urlopen
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Optional, Dict, Any, List, Tuple
 
 from pyVim import connect
 from pyVmomi import vim, vmodl
 
 from .config import Config
+from .models import DatastoreInfo, DatastoreClusterInfo, PerformanceCounterInfo, SnapshotInfo
+
+
+def _insecure_ssl_context() -> ssl.SSLContext:
+    """Build a client SSL context that skips certificate and hostname verification."""
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False  # Disable hostname checking
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+# Shared by every connection and upload made with insecure=True; building a context
+# loads cipher and protocol defaults, so do it once per process
+_INSECURE_SSL_CONTEXT = _insecure_ssl_context()
+
+
+# Bytes per GiB, for the *_gb fields of tool results
+_GIB = 1 << 30
+
+
+# Marks a lazily resolved attribute that has not been looked up yet (None is a valid value)
+_UNRESOLVED = object()
+
+
+# Logged-in service instances shared by managers with the same connection settings:
+# (host, user, password, insecure) -> [service instance, number of managers using it]
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+class ObjectNotFound(Exception):
+    """Raised when a VM or host looked up by name does not exist."""
+
+
+class _UpdateSubscription:
+    """
+    Persistent WaitForUpdatesEx loop on a private PropertyCollector.
+    
+    A background thread buffers property changes so repeated wait_for_updates calls
+    read from memory instead of creating a new filter each time. It also keeps the
+    latest properties of every matching object, so new readers start from the
+    current state rather than from whatever history is still buffered.
+    """
+    
+    IDLE_TIMEOUT = 600      # Seconds without readers before the subscription shuts down
+    MAX_BUFFERED = 10000    # Oldest buffered updates are dropped beyond this
+    
+    _ids = itertools.count(1)
+    
+    def __init__(self, collector, filter_spec):
+        self.id = next(self._ids)
+        self.collector = collector
+        try:
+            collector.CreateFilter(filter_spec, True)
+        except Exception:
+            # e.g. InvalidProperty for a bad property name; don't leave the collector behind
+            try:
+                collector.DestroyPropertyCollector()
+            except Exception:
+                pass
+            raise
+        self.updates = collections.deque(maxlen=self.MAX_BUFFERED)  # (sequence, update) pairs
+        self.sequence = 0
+        self.state = {}         # object reference -> latest {property: value} of objects in the filter
+        self.synced = False     # Set once the initial state of every object has arrived
+        self.closed = False
+        self.error = None
+        self.last_read = time.monotonic()
+        self.cond = threading.Condition()
+        threading.Thread(target=self._run, name="vsphere-updates", daemon=True).start()
+    
+    def _run(self):
+        wait_opts = vmodl.query.PropertyCollector.WaitOptions(maxWaitSeconds=30)
+        version = ''
+        try:
+            while time.monotonic() - self.last_read < self.IDLE_TIMEOUT:
+                update_set = self.collector.WaitForUpdatesEx(version, wait_opts)
+                if update_set is None:
+                    continue
+                version = update_set.version
+                batch = []
+                for filter_set in update_set.filterSet:
+                    for object_set in filter_set.objectSet:
+                        obj_ref = str(object_set.obj).strip("'")
+                        kind = object_set.kind
+                        if kind in ('enter', 'modify'):
+                            changes = {}
+                            for change in object_set.changeSet:
+                                changes[change.name] = str(change.val) if change.val else None
+                            batch.append({"object": obj_ref, "kind": kind, "changes": changes})
+                        elif kind == 'leave':
+                            batch.append({"object": obj_ref, "kind": "removed"})
+                with self.cond:
+                    for update in batch:
+                        self.sequence += 1
+                        self.updates.append((self.sequence, update))
+                        if update["kind"] == "removed":
+                            self.state.pop(update["object"], None)
+                        else:
+                            self.state.setdefault(update["object"], {}).update(update["changes"])
+                    self.synced = True
+                    self.cond.notify_all()
+        except Exception as e:
+            logging.warning(f"Property update subscription stopped: {e}")
+            self.error = str(e)
+        finally:
+            with self.cond:
+                self.closed = True
+                self.cond.notify_all()
+            try:
+                # Also removes the collector's filter
+                self.collector.DestroyPropertyCollector()
+            except Exception:
+                pass
+    
+    def snapshot(self, timeout: float):
+        """Return (an "enter" update per object with its latest properties, current sequence)."""
+        deadline = time.monotonic() + timeout
+        with self.cond:
+            self.last_read = time.monotonic()
+            while not self.synced and not self.closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.cond.wait(remaining)
+            updates = [{"object": obj_ref, "kind": "enter", "changes": dict(changes)}
+                       for obj_ref, changes in self.state.items()]
+            return updates, self.sequence
+    
+    def read(self, since: int, timeout: float):
+        """
+        Return (updates after sequence since, latest sequence, truncated), waiting up to
+        timeout for new ones; truncated is set when updates after since were already dropped.
+        """
+        deadline = time.monotonic() + timeout
+        with self.cond:
+            self.last_read = time.monotonic()
+            if self.updates and self.updates[0][0] > since + 1:
+                return [], since, True
+            while self.sequence <= since and not self.closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.cond.wait(remaining)
+            return [update for sequence, update in self.updates if sequence > since], self.sequence, False
+
+
+class _TaskWatcher:
+    """
+    Resolves a Future per vCenter task from one shared PropertyCollector.
+    
+    A single background thread waits on WaitForUpdatesEx for every watched task, so
+    in-flight tasks cost a Future each instead of a collector and a blocked poll loop.
+    Futures can also be awaited from the event loop through asyncio.wrap_future.
+    """
+    
+    _PATHS = ["info.state", "info.error", "info.result"]
+    
+    def __init__(self, collector, epoch: int):
+        self.collector = collector
+        self.epoch = epoch              # connection_epoch of the session the collector belongs to
+        # Task MoRef id -> (shared [PropertyFilter, tasks of it still pending], waiting Futures, latest values)
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.running = False
+    
+    def watch(self, task: vim.Task) -> Future:
+        """Start watching a task; the Future resolves to its final info values."""
+        return self.watch_many([task])[0]
+    
+    def watch_many(self, tasks: list) -> List[Future]:
+        """
+        Start watching several tasks; each Future resolves to its task's final info values.
+        
+        Tasks that are not watched yet share one new filter, so watching a batch costs a
+        single CreateFilter call; a task that is already watched just gains a waiter.
+        """
+        futures = [Future() for _ in tasks]
+        # Registered under the lock so the thread cannot see a task's first update before its entry
+        with self.lock:
+            new = {}                    # task MoRef id -> (task, Futures)
+            for task, future in zip(tasks, futures):
+                entry = self.pending.get(task._moId)
+                if entry is not None:
+                    entry[1].append(future)
+                elif task._moId in new:
+                    new[task._moId][1].append(future)
+                else:
+                    new[task._moId] = (task, [future])
+            if new:
+                PC = vmodl.query.PropertyCollector
+                spec = PC.FilterSpec(
+                    objectSet=[PC.ObjectSpec(obj=task, skip=False) for task, _ in new.values()],
+                    propSet=[PC.PropertySpec(type=vim.Task, pathSet=self._PATHS, all=False)]
+                )
+                shared = [self.collector.CreateFilter(spec, True), len(new)]
+                for task_id, (task, waiters) in new.items():
+                    self.pending[task_id] = (shared, waiters, {})
+            if self.pending and not self.running:
+                self.running = True
+                threading.Thread(target=self._run, name="vsphere-tasks", daemon=True).start()
+        return futures
+    
+    def _run(self):
+        finished = (vim.TaskInfo.State.success, vim.TaskInfo.State.error)
+        wait_opts = vmodl.query.PropertyCollector.WaitOptions(maxWaitSeconds=60)
+        version = ''
+        try:
+            while True:
+                update_set = self.collector.WaitForUpdatesEx(version, wait_opts)
+                with self.lock:
+                    if update_set is not None:
+                        version = update_set.version
+                        for filter_set in update_set.filterSet:
+                            for object_set in filter_set.objectSet:
+                                task_id = object_set.obj._moId
+                                entry = self.pending.get(task_id)
+                                if entry is None:
+                                    continue
+                                shared, waiters, info = entry
+                                for change in object_set.changeSet:
+                                    info[change.name] = change.val
+                                if info.get("info.state") in finished:
+                                    del self.pending[task_id]
+                                    shared[1] -= 1
+                                    if shared[1] == 0:
+                                        try:
+                                            shared[0].DestroyPropertyFilter()
+                                        except Exception:
+                                            pass
+                                    for future in waiters:
+                                        future.set_result(info)
+                    if not self.pending:
+                        # The next watch() starts a new thread
+                        self.running = False
+                        return
+        except Exception as e:
+            logging.warning(f"Task watcher stopped: {e}")
+            with self.lock:
+                self.running = False
+                for shared, waiters, info in self.pending.values():
+                    for future in waiters:
+                        future.set_exception(e)
+                self.pending.clear()
 
 
 class VMwareManager:
@@ -18,104 +273,253 @@ class VMwareManager:
     
     def __init__(self, config: Config):
         self.config = config
-        self.si = None               # Service instance (ServiceInstance)
+        self.si = None               # Service instance (ServiceInstance), possibly shared with other managers
+        self._session_key = None     # Key of self.si in _sessions while this manager holds a reference
         self.content = None          # vSphere content root
-        self.datacenter_obj = None
-        self.resource_pool = None
-        self.datastore_obj = None
-        self.network_obj = None
+        # Default placement targets, resolved on first use through the properties below
+        self._datacenter_obj = _UNRESOLVED
+        self._resource_pool = _UNRESOLVED
+        self._datastore_obj = _UNRESOLVED
+        self._network_obj = _UNRESOLVED
         self.authenticated = False   # Authentication flag for API key verification
+        self.connection_epoch = 0    # Incremented on every (re)connection; lets callers drop session-scoped caches
+        self._update_subscriptions = {}  # (object_type, properties, epoch) -> _UpdateSubscription
+        self._update_subscriptions_lock = threading.Lock()
+        self._session_cookies = None # Session cookie dict for HTTP file transfers, parsed once per connection
+        self._http = None            # requests.Session for datastore and guest file transfers, created on first use
+        self._http_lock = threading.Lock()
+        self._host_slots = {}        # (operation, host MoRef id) -> BoundedSemaphore capping that operation's tasks on the host
+        self._host_slots_lock = threading.Lock()
+        # Caps the tasks of this manager in flight on vCenter; None when config.max_concurrent_tasks is 0
+        self._task_slots = threading.BoundedSemaphore(config.max_concurrent_tasks) if config.max_concurrent_tasks > 0 else None
+        self._task_watcher_obj = None  # _TaskWatcher of the current session, created on the first task wait
+        self._task_watcher_lock = threading.Lock()
+        self._views = {}             # (managed object type, root folder or None) -> ContainerView, reused across queries
+        self._views_lock = threading.Lock()
+        self._name_index = {}        # (managed object type, root or None) -> (monotonic build time, {name: object})
+        self._snapshot_index = {}    # VM MoRef id -> (monotonic build time, {snapshot name: SnapshotTree})
+        self._vm_hosts = {}          # VirtualMachine -> HostSystem it ran on when the VM name index was last built
+        self._counter_by_name = {}   # "group.name.rollup" -> counter key; keys differ between vCenters
+        self._counter_by_key = {}    # Counter key -> PerfCounterInfo
+        self._counter_infos = None   # list_performance_counters result; None until the catalog is loaded
         self._connect_vcenter()
 
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Destroy the cached container views and release this manager's share of the session."""
+        self._destroy_views()
+        if getattr(self, "_http", None) is not None:
+            self._http.close()
+            self._http = None
+        if getattr(self, "_session_key", None) is not None:
+            with _sessions_lock:
+                self._release_session()
+
+    def _destroy_views(self):
+        """Destroy the cached container views on the server, ignoring failures from a dead session."""
+        views, self._views = getattr(self, "_views", {}), {}
+        for view in views.values():
+            try:
+                view.Destroy()
+            except Exception:
+                pass
+
+    def _release_session(self):
+        """Drop this manager's reference to its shared session, logging out after the last one; needs _sessions_lock."""
+        key, self._session_key = self._session_key, None
+        entry = _sessions.get(key)
+        if entry is None or entry[0] is not self.si:
+            # Already replaced by another manager's reconnect
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del _sessions[key]
+            try:
+                connect.Disconnect(entry[0])
+            except Exception:
+                pass
+
     def _connect_vcenter(self):
-        """Connect to vCenter/ESXi and retrieve main resource object references."""
-        try:
-            if self.config.insecure:
-                # Connection method without SSL certificate verification
-                context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-                context.check_hostname = False  # Disable hostname checking
-                context.verify_mode = ssl.CERT_NONE
-                self.si = connect.SmartConnect(
-                    host=self.config.vcenter_host,
-                    user=self.config.vcenter_user,
-                    pwd=self.config.vcenter_password,
-                    sslContext=context)
-            else:
-                # Standard SSL verification connection
-                self.si = connect.SmartConnect(
-                    host=self.config.vcenter_host,
-                    user=self.config.vcenter_user,
-                    pwd=self.config.vcenter_password)
-        except Exception as e:
-            logging.error(f"Failed to connect to vCenter/ESXi: {e}")
-            raise
+        """Connect to vCenter/ESXi, reusing a live session of another manager with the same settings."""
+        key = (self.config.vcenter_host, self.config.vcenter_user, self.config.vcenter_password, self.config.insecure)
+        with _sessions_lock:
+            if self._session_key is not None:
+                entry = _sessions.get(self._session_key)
+                if entry is not None and entry[0] is self.si and entry[1] > 1:
+                    # Other managers keep the old session logged in, so its views
+                    # would otherwise stay allocated on the server
+                    self._destroy_views()
+                self._release_session()
+            entry = _sessions.get(key)
+            if entry is not None:
+                try:
+                    entry[0].CurrentTime()
+                except Exception:
+                    # Expired; the managers still holding it reconnect on their next call
+                    del _sessions[key]
+                    entry = None
+            if entry is None:
+                try:
+                    if self.config.insecure:
+                        # Connection method without SSL certificate verification
+                        si = connect.SmartConnect(
+                            host=self.config.vcenter_host,
+                            user=self.config.vcenter_user,
+                            pwd=self.config.vcenter_password,
+                            sslContext=_INSECURE_SSL_CONTEXT)
+                    else:
+                        # Standard SSL verification connection
+                        si = connect.SmartConnect(
+                            host=self.config.vcenter_host,
+                            user=self.config.vcenter_user,
+                            pwd=self.config.vcenter_password)
+                except Exception as e:
+                    logging.error(f"Failed to connect to vCenter/ESXi: {e}")
+                    raise
+                entry = _sessions[key] = [si, 0]
+            entry[1] += 1
+            self.si = entry[0]
+            self._session_key = key
         # Retrieve content root object
         self.content = self.si.RetrieveContent()
+        self.connection_epoch += 1
+        # Views, object references and the counter catalog belong to the previous session.
+        # Everything else is resolved on first use, so read-only clients connect quickly
+        self._views = {}
+        self._name_index = {}
+        self._snapshot_index = {}
+        self._vm_hosts = {}
+        self._session_cookies = None
+        self._counter_infos = None
+        self._datacenter_obj = self._resource_pool = self._datastore_obj = self._network_obj = _UNRESOLVED
         logging.info("Successfully connected to VMware vCenter/ESXi API")
 
-        # Retrieve target datacenter object
+    def _load_perf_counters(self):
+        """Fetch the performance counter catalog, which is stable for a session, and index it."""
+        counters = self.content.perfManager.perfCounter
+        self._counter_by_name = {f"{c.groupInfo.key}.{c.nameInfo.key}.{c.rollupType}": c.key
+                                 for c in counters}
+        self._counter_by_key = {c.key: c for c in counters}
+        self._counter_infos = [
+            PerformanceCounterInfo(
+                key=counter.key,
+                group=counter.groupInfo.key,
+                name=counter.nameInfo.key,
+                rollup_type=str(counter.rollupType),
+                stats_type=str(counter.statsType),
+                unit=counter.unitInfo.key,
+                description=counter.nameInfo.summary if counter.nameInfo else "",
+            )
+            for counter in counters
+        ]
+
+    @property
+    def datacenter_obj(self):
+        """Target datacenter, resolved on first use."""
+        if self._datacenter_obj is _UNRESOLVED:
+            self._resolve_datacenter()
+        return self._datacenter_obj
+
+    @property
+    def resource_pool(self):
+        """Default resource pool for new VMs, resolved on first use."""
+        if self._resource_pool is _UNRESOLVED:
+            self._resolve_resource_pool()
+        return self._resource_pool
+
+    @property
+    def datastore_obj(self):
+        """Default datastore for new VMs, resolved on first use."""
+        if self._datastore_obj is _UNRESOLVED:
+            self._resolve_datastore()
+        return self._datastore_obj
+
+    @property
+    def network_obj(self):
+        """Default network for new VMs (may be None), resolved on first use."""
+        if self._network_obj is _UNRESOLVED:
+            self._resolve_network()
+        return self._network_obj
+
+    def _resolve_datacenter(self):
+        """Find the configured datacenter, or the first one; placement and lookups are scoped to it."""
+        # Each lookup below asks a typed view for names in one query
+        datacenters = self._retrieve(vim.Datacenter, ["name"])
         if self.config.datacenter:
             # Find specified datacenter by name
-            self.datacenter_obj = next((dc for dc in self.content.rootFolder.childEntity
-                                        if isinstance(dc, vim.Datacenter) and dc.name == self.config.datacenter), None)
-            if not self.datacenter_obj:
+            datacenter = next((dc for dc, props in datacenters
+                               if props.get("name") == self.config.datacenter), None)
+            if not datacenter:
                 logging.error(f"Datacenter named {self.config.datacenter} not found")
                 raise Exception(f"Datacenter {self.config.datacenter} not found")
         else:
             # Default to the first available datacenter
-            self.datacenter_obj = next((dc for dc in self.content.rootFolder.childEntity
-                                        if isinstance(dc, vim.Datacenter)), None)
-        if not self.datacenter_obj:
+            datacenter = next((dc for dc, _ in datacenters), None)
+        if not datacenter:
             raise Exception("No datacenter object found")
+        self._datacenter_obj = datacenter
 
+    def _resolve_resource_pool(self):
+        """Use the configured cluster's resource pool, or that of the first compute resource."""
         # Retrieve resource pool (if a cluster is configured, use the cluster's resource pool; otherwise, use the host resource pool)
         compute_resource = None
         if self.config.cluster:
             # Find specified cluster
-            for folder in self.datacenter_obj.hostFolder.childEntity:
-                if isinstance(folder, vim.ClusterComputeResource) and folder.name == self.config.cluster:
-                    compute_resource = folder
-                    break
+            clusters = self._retrieve(vim.ClusterComputeResource, ["name", "resourcePool"],
+                                      root=self.datacenter_obj.hostFolder)
+            compute_resource = next((props for _, props in clusters
+                                     if props.get("name") == self.config.cluster), None)
             if not compute_resource:
                 logging.error(f"Cluster named {self.config.cluster} not found")
                 raise Exception(f"Cluster {self.config.cluster} not found")
         else:
             # Default to the first ComputeResource (cluster or standalone host)
-            compute_resource = next((cr for cr in self.datacenter_obj.hostFolder.childEntity
-                                      if isinstance(cr, vim.ComputeResource)), None)
+            compute_resources = self._retrieve(vim.ComputeResource, ["name", "resourcePool"],
+                                               root=self.datacenter_obj.hostFolder)
+            compute_resource = next((props for _, props in compute_resources), None)
         if not compute_resource:
             raise Exception("No compute resource (cluster or host) found")
-        self.resource_pool = compute_resource.resourcePool
+        self._resource_pool = compute_resource.get("resourcePool")
         logging.info(f"Using resource pool: {self.resource_pool.name}")
 
+    def _resolve_datastore(self):
+        """Use the configured datastore, or the one with the most free space."""
         # Retrieve datastore object
+        datastores = self._retrieve(vim.Datastore, ["name", "summary.freeSpace"],
+                                    root=self.datacenter_obj.datastoreFolder)
         if self.config.datastore:
             # Find specified datastore in the datacenter
-            self.datastore_obj = next((ds for ds in self.datacenter_obj.datastoreFolder.childEntity
-                                       if isinstance(ds, vim.Datastore) and ds.name == self.config.datastore), None)
-            if not self.datastore_obj:
+            datastore = next((ds for ds, props in datastores
+                              if props.get("name") == self.config.datastore), None)
+            if not datastore:
                 logging.error(f"Datastore named {self.config.datastore} not found")
                 raise Exception(f"Datastore {self.config.datastore} not found")
+            datastore_name = self.config.datastore
         else:
             # Default to the datastore with the largest available capacity
-            datastores = [ds for ds in self.datacenter_obj.datastoreFolder.childEntity if isinstance(ds, vim.Datastore)]
             if not datastores:
                 raise Exception("No available datastore found in the datacenter")
             # Select the one with the maximum free space
-            self.datastore_obj = max(datastores, key=lambda ds: ds.summary.freeSpace)
-        logging.info(f"Using datastore: {self.datastore_obj.name}")
+            datastore, props = max(datastores, key=lambda item: item[1].get("summary.freeSpace", 0))
+            datastore_name = props.get("name")
+        self._datastore_obj = datastore
+        logging.info(f"Using datastore: {datastore_name}")
 
+    def _resolve_network(self):
+        """Use the configured network; without one, new VMs get no network adapter."""
         # Retrieve network object (network or distributed virtual portgroup)
         if self.config.network:
-            # Find specified network in the datacenter network list
-            networks = self.datacenter_obj.networkFolder.childEntity
-            self.network_obj = next((net for net in networks if net.name == self.config.network), None)
-            if not self.network_obj:
+            # Find specified network in the datacenter
+            network = self.find_network(self.config.network)
+            if not network:
                 logging.error(f"Network {self.config.network} not found")
                 raise Exception(f"Network {self.config.network} not found")
-            logging.info(f"Using network: {self.network_obj.name}")
+            self._network_obj = network
+            logging.info(f"Using network: {self.config.network}")
         else:
-            self.network_obj = None  # If no network is specified, VM creation can choose to not connect to a network
+            self._network_obj = None  # If no network is specified, VM creation can choose to not connect to a network
 
     def _ensure_connected(self):
         """Verify the vCenter session is alive and reconnect if necessary.
@@ -148,171 +552,345 @@ class VMwareManager:
             f"Failed to reconnect to vCenter after {self.config.max_retries} attempt(s)."
         )
 
+    def _container_view(self, obj_type, root=None):
+        """
+        Return the session's ContainerView over every object of obj_type below root
+        (default: the inventory root folder), creating it on first use.
+        """
+        key = (obj_type, root)
+        view = self._views.get(key)
+        if view is None:
+            with self._views_lock:
+                view = self._views.get(key)
+                if view is None:
+                    view = self.content.viewManager.CreateContainerView(
+                        root if root is not None else self.content.rootFolder, [obj_type], True)
+                    self._views[key] = view
+        return view
+
+    # Explicit object lists longer than this are fetched as concurrent chunks
+    _RETRIEVE_CHUNK_SIZE = 100
+
+    def _retrieve(self, obj_type, path_set: List[str], objects: Optional[list] = None,
+                  root=None) -> List[Tuple[Any, Dict[str, Any]]]:
+        """
+        Fetch properties of many managed objects with a single PropertyCollector query.
+        
+        Args:
+            obj_type: Managed object type, e.g. vim.VirtualMachine
+            path_set: Property paths to fetch, e.g. ["name", "runtime.powerState"]
+            objects: Objects to read; defaults to every object of obj_type in the inventory
+            root: Folder to search below when objects is not given; defaults to the inventory root
+            
+        Returns:
+            List of (object, {property path: value}) pairs; unset properties are omitted
+        """
+        PC = vmodl.query.PropertyCollector
+        if objects is None:
+            object_set = [PC.ObjectSpec(
+                obj=self._container_view(obj_type, root),
+                skip=True,
+                selectSet=[PC.TraversalSpec(name="traverseView", path="view", type=vim.view.ContainerView, skip=False)]
+            )]
+        else:
+            if not objects:
+                return []
+            if len(objects) > self._RETRIEVE_CHUNK_SIZE and self.config.fetch_concurrency > 1:
+                # Large explicit batches are split so several vCenter queries run at once
+                size = self._RETRIEVE_CHUNK_SIZE
+                chunks = [objects[i:i + size] for i in range(0, len(objects), size)]
+                with ThreadPoolExecutor(max_workers=min(self.config.fetch_concurrency, len(chunks)),
+                                        thread_name_prefix="vsphere-fetch") as pool:
+                    parts = pool.map(lambda chunk: self._retrieve(obj_type, path_set, chunk), chunks)
+                    return [pair for part in parts for pair in part]
+            object_set = [PC.ObjectSpec(obj=obj, skip=False) for obj in objects]
+        filter_spec = PC.FilterSpec(
+            objectSet=object_set,
+            propSet=[PC.PropertySpec(type=obj_type, pathSet=path_set, all=False)]
+        )
+        
+        collector = self.content.propertyCollector
+        results = []
+        result = collector.RetrievePropertiesEx([filter_spec], PC.RetrieveOptions())
+        while result:
+            for obj_content in result.objects:
+                results.append((obj_content.obj, {prop.name: prop.val for prop in obj_content.propSet}))
+            if not result.token:
+                break
+            result = collector.ContinueRetrievePropertiesEx(result.token)
+        return results
+
+    def _fetch_props(self, obj, path_set: List[str]) -> Dict[str, Any]:
+        """Fetch several properties of one managed object in a single round-trip; unset properties are omitted."""
+        results = self._retrieve(type(obj), path_set, [obj])
+        return results[0][1] if results else {}
+
     def list_vms(self) -> list:
         """List all virtual machine names."""
         self._ensure_connected()
-        vm_list = []
-        # Create a view to iterate over all virtual machines
-        container = self.content.viewManager.CreateContainerView(self.content.rootFolder, [vim.VirtualMachine], True)
-        for vm in container.view:
-            vm_list.append(vm.name)
-        container.Destroy()
-        return vm_list
+        return [props["name"] for _, props in self._index_names(vim.VirtualMachine, ["name"])]
 
     def find_resource_pool(self, pool_name: str) -> Optional[vim.ResourcePool]:
         """Find a resource pool by name, searching the datacenter recursively."""
-        container = self.content.viewManager.CreateContainerView(
-            self.datacenter_obj, [vim.ResourcePool], True)
-        result = None
-        for rp in container.view:
-            if rp.name == pool_name:
-                result = rp
-                break
-        container.Destroy()
-        return result
+        return self._objects_by_name(vim.ResourcePool, [pool_name], self.datacenter_obj).get(pool_name)
 
     def find_datastore_cluster(self, cluster_name: str) -> Optional[vim.StoragePod]:
         """Find a datastore cluster (StoragePod) by name."""
-        container = self.content.viewManager.CreateContainerView(
-            self.datacenter_obj, [vim.StoragePod], True)
-        result = None
-        for pod in container.view:
-            if pod.name == cluster_name:
-                result = pod
-                break
-        container.Destroy()
-        return result
+        return self._objects_by_name(vim.StoragePod, [cluster_name], self.datacenter_obj).get(cluster_name)
 
     def _pick_datastore_from_cluster(self, pod: vim.StoragePod) -> vim.Datastore:
         """Return the datastore with the most free space from a StoragePod."""
         datastores = [ds for ds in pod.childEntity if isinstance(ds, vim.Datastore)]
         if not datastores:
             raise Exception(f"Datastore cluster '{pod.name}' has no datastores")
-        return max(datastores, key=lambda ds: ds.summary.freeSpace)
+        # Free space of every member in one query
+        free_space = self._retrieve(vim.Datastore, ["summary.freeSpace"], datastores)
+        return max(free_space, key=lambda item: item[1].get("summary.freeSpace", 0))[0]
 
     def find_datastore(self, datastore_name: str) -> Optional[vim.Datastore]:
         """Find a datastore by name, searching top-level and inside StoragePods."""
-        container = self.content.viewManager.CreateContainerView(
-            self.datacenter_obj, [vim.Datastore], True)
-        result = None
-        for ds in container.view:
-            if ds.name == datastore_name:
-                result = ds
-                break
-        container.Destroy()
-        return result
+        return self._objects_by_name(vim.Datastore, [datastore_name], self.datacenter_obj).get(datastore_name)
+
+    def find_network(self, network_name: str) -> Optional[vim.Network]:
+        """Find a network or distributed portgroup by name in the datacenter."""
+        return self._objects_by_name(vim.Network, [network_name], self.datacenter_obj).get(network_name)
 
     def find_folder(self, folder_name: str) -> Optional[vim.Folder]:
         """Find a VM folder by name, searching the datacenter's vmFolder tree recursively."""
-        def _search(folder):
-            if folder.name == folder_name:
-                return folder
-            for child in getattr(folder, 'childEntity', []):
-                if isinstance(child, vim.Folder):
-                    result = _search(child)
-                    if result is not None:
-                        return result
-            return None
+        vm_folder = self.datacenter_obj.vmFolder
+        folder = self._objects_by_name(vim.Folder, [folder_name], vm_folder).get(folder_name)
+        if folder is None and vm_folder.name == folder_name:
+            # The view below vmFolder does not include vmFolder itself
+            return vm_folder
+        return folder
+
+    def _objects_by_name(self, obj_type, names: list, root=None) -> Dict[str, Any]:
+        """
+        Map each requested name to the first object of obj_type with that name below
+        root (default: the whole inventory).
+        
+        Names are resolved through a short-lived name index, so a hit costs no vSphere
+        round-trip. The index is rebuilt with one PropertyCollector query once it is
+        older than config.index_ttl, or when a name is missing so that newly created
+        objects are found immediately.
+        """
+        entry = self._name_index.get((obj_type, root))
+        if entry is not None and time.monotonic() - entry[0] < self.config.index_ttl:
+            found = {name: entry[1][name] for name in names if name in entry[1]}
+            if len(found) == len(set(names)):
+                return found
+        self._index_names(obj_type, ["name"], root)
+        index = self._name_index[(obj_type, root)][1]
+        return {name: index[name] for name in names if name in index}
+
+    def _props_by_name(self, obj_type, names: list, path_set: List[str],
+                       root=None) -> Dict[str, Tuple[Any, Dict[str, Any]]]:
+        """
+        Map each requested name to (object, {property path: value}) for the object of
+        obj_type with that name below root, fetching path_set in one query.
+        
+        "name" is fetched along with path_set, so an index hit that was renamed or
+        deleted outside this server since the index was built is noticed; the index is
+        then rebuilt once and the names are resolved again. Names that do not resolve
+        to a live object with that name are left out.
+        """
+        fetch_paths = path_set if "name" in path_set else path_set + ["name"]
+        for attempt in range(2):
+            objects = self._objects_by_name(obj_type, names, root)
+            try:
+                by_obj = dict(self._retrieve(obj_type, fetch_paths, list(objects.values())))
+            except vmodl.fault.ManagedObjectNotFound:
+                if attempt:
+                    raise
+                by_obj = {}
+            found = {name: (obj, by_obj[obj]) for name, obj in objects.items()
+                     if obj in by_obj and by_obj[obj].get("name") == name}
+            if len(found) == len(objects) or attempt:
+                return found
+            # Stale hits: drop the index so the next pass rebuilds it
+            self._name_index.pop((obj_type, root), None)
+
+    def _search_unindexed(self, obj_type, name: str, search: Callable[[], Any]) -> None:
+        """
+        Add name to a fresh inventory-wide name index of obj_type that lacks it, using one SearchIndex call.
+        
+        Only names the index does not know are searched (typically objects created since
+        it was built), so a match cannot disagree with an indexed object of the same
+        name. The match is then checked by name like any other index hit; if search
+        finds nothing, the caller's lookup rebuilds the index as before.
+        """
+        entry = self._name_index.get((obj_type, None))
+        if entry is None or name in entry[1] or time.monotonic() - entry[0] >= self.config.index_ttl:
+            return
+        obj = search()
+        if isinstance(obj, obj_type):
+            entry[1].setdefault(name, obj)
 
-        return _search(self.datacenter_obj.vmFolder)
+    def _index_names(self, obj_type, path_set: List[str], root=None) -> List[Tuple[Any, Dict[str, Any]]]:
+        """
+        Retrieve path_set (which must include "name") for every object of obj_type below
+        root and rebuild that name index from the same result, so listings also refresh lookups.
+        
+        For VMs runtime.host is read in the same query, so the per-host task caps need
+        no lookup of their own for a VM that was just resolved by name.
+        """
+        now = time.monotonic()
+        if obj_type is vim.VirtualMachine and "runtime.host" not in path_set:
+            path_set = path_set + ["runtime.host"]
+        results = self._retrieve(obj_type, path_set, root=root)
+        index = {}
+        for obj, props in results:
+            index.setdefault(props.get("name"), obj)
+        self._name_index[(obj_type, root)] = (now, index)
+        if obj_type is vim.VirtualMachine:
+            self._vm_hosts = {obj: props.get("runtime.host") for obj, props in results}
+        return results
 
     def find_vm(self, name: str) -> Optional[vim.VirtualMachine]:
-        """Find virtual machine object by name."""
+        """
+        Find virtual machine object by name through the inventory-wide name index shared with list_vms.
+        
+        The hit is checked against the VM's current name, in the same query that
+        refreshes its host for the per-host task caps.
+        """
         self._ensure_connected()
-        container = self.content.viewManager.CreateContainerView(self.content.rootFolder, [vim.VirtualMachine], True)
-        vm_obj = None
-        for vm in container.view:
-            if vm.name == name:
-                vm_obj = vm
-                break
-        container.Destroy()
-        return vm_obj
+        datacenter = self._datacenter_obj
+        if datacenter is not _UNRESOLVED and datacenter is not None:
+            # A new VM directly in the datacenter's VM folder resolves without rebuilding the index
+            self._search_unindexed(vim.VirtualMachine, name,
+                                   lambda: self.content.searchIndex.FindChild(datacenter.vmFolder, name))
+        found = self._props_by_name(vim.VirtualMachine, [name], ["runtime.host"]).get(name)
+        if found is None:
+            return None
+        vm, props = found
+        self._vm_hosts[vm] = props.get("runtime.host")
+        return vm
 
     def get_vm_performance(self, vm_name: str) -> Dict[str, Any]:
         """Retrieve performance data (CPU, memory, storage, and network) for the specified virtual machine."""
+        stats = self.get_vms_performance_batch([vm_name])[vm_name]
+        if stats is None:
+            raise ObjectNotFound(f"VM {vm_name} not found")
+        return stats
+
+    # Properties read by get_vm_performance and get_vms_performance_batch
+    _VM_PERFORMANCE_PROPERTIES = [
+        "summary.quickStats.overallCpuUsage", "summary.quickStats.guestMemoryUsage", "summary.storage.committed",
+    ]
+
+    def get_vms_performance_batch(self, vm_names: list) -> Dict[str, Any]:
+        """
+        Get the get_vm_performance data for several VMs with one property query and one QueryStats call.
+        
+        Returns:
+            Dict mapping each requested name to its performance data, or None if no such VM exists
+        """
         self._ensure_connected()
-        vm = self.find_vm(vm_name)
-        if not vm:
-            raise Exception(f"VM {vm_name} not found")
-        # CPU and memory usage (obtained from quickStats)
-        stats = {}
-        qs = vm.summary.quickStats
-        stats["cpu_usage"] = qs.overallCpuUsage  # MHz
-        stats["memory_usage"] = qs.guestMemoryUsage  # MB
-        # Storage usage (committed storage, in GB)
-        committed = vm.summary.storage.committed if vm.summary.storage else 0
-        stats["storage_usage"] = round(committed / (1024**3), 2)  # Convert to GB
-        # Network usage (obtained from host or VM NIC statistics, latest sample)
-        # Here we simply obtain the latest performance counter for VM network I/O
-        net_bytes_transmitted = 0
-        net_bytes_received = 0
-        try:
-            pm = self.content.perfManager
-            # Define performance counter IDs to query: network transmitted and received bytes
-            counter_ids = []
-            for c in pm.perfCounter:
-                counter_full_name = f"{c.groupInfo.key}.{c.nameInfo.key}.{c.rollupType}"
-                if counter_full_name in ("net.transmitted.average", "net.received.average"):
-                    counter_ids.append(c.key)
-            if counter_ids:
-                query = vim.PerformanceManager.QuerySpec(maxSample=1, entity=vm, metricId=[vim.PerformanceManager.MetricId(counterId=cid, instance="*") for cid in counter_ids])
-                stats_res = pm.QueryStats(querySpec=[query])
-                for series in stats_res[0].value:
+        # Only the leaf values used below, rather than the whole quickStats and storage objects
+        resolved = self._props_by_name(vim.VirtualMachine, vm_names, self._VM_PERFORMANCE_PROPERTIES)
+        vms = {name: vm for name, (vm, _) in resolved.items()}
+        by_obj = dict(resolved.values())
+        
+        results = {}
+        for name in vm_names:
+            vm = vms.get(name)
+            if vm is None or vm not in by_obj:
+                results[name] = None
+                continue
+            props = by_obj[vm]
+            results[name] = {
+                # CPU and memory usage (obtained from quickStats)
+                "cpu_usage": props.get("summary.quickStats.overallCpuUsage"),  # MHz
+                "memory_usage": props.get("summary.quickStats.guestMemoryUsage"),  # MB
+                # Storage usage (committed storage, in GB)
+                "storage_usage": round(props.get("summary.storage.committed", 0) / _GIB, 2),
+            }
+        
+        # Network usage (latest sample of the VM NIC counters), for all VMs in one QueryStats call
+        if self._counter_infos is None:
+            self._load_perf_counters()
+        transmitted_id = self._counter_by_name.get("net.transmitted.average")
+        received_id = self._counter_by_name.get("net.received.average")
+        counter_ids = [cid for cid in (transmitted_id, received_id) if cid is not None]
+        found = [vm for vm in vms.values() if vm in by_obj]
+        net_stats = {}
+        missing = (0, 0)
+        if counter_ids and found:
+            metric_ids = [vim.PerformanceManager.MetricId(counterId=cid, instance="*") for cid in counter_ids]
+            query_specs = [vim.PerformanceManager.QuerySpec(maxSample=1, entity=vm, metricId=metric_ids)
+                           for vm in found]
+            try:
+                entity_metrics = self.content.perfManager.QueryStats(querySpec=query_specs) or []
+            except (vmodl.fault.InvalidArgument, vmodl.fault.ManagedObjectNotFound) as e:
+                # E.g. a VM without realtime stats (powered off) or deleted since the lookup;
+                # report the network figures as unknown but keep the other stats
+                logging.warning(f"Failed to retrieve network performance data: {e}")
+                entity_metrics = []
+                missing = (None, None)
+            for entity_metric in entity_metrics:
+                net_bytes_transmitted = 0
+                net_bytes_received = 0
+                for series in entity_metric.value:
                     # Sum data from each network interface
-                    if series.id.counterId == counter_ids[0]:
+                    if series.id.counterId == transmitted_id:
                         net_bytes_transmitted = sum(series.value)
-                    elif series.id.counterId == counter_ids[1]:
+                    elif series.id.counterId == received_id:
                         net_bytes_received = sum(series.value)
-            stats["network_transmit_KBps"] = net_bytes_transmitted
-            stats["network_receive_KBps"] = net_bytes_received
-        except Exception as e:
-            # If obtaining performance counters fails, log the error but do not terminate
-            logging.warning(f"Failed to retrieve network performance data: {e}")
-            stats["network_transmit_KBps"] = None
-            stats["network_receive_KBps"] = None
-        return stats
+                net_stats[entity_metric.entity] = (net_bytes_transmitted, net_bytes_received)
+        for name, stats in results.items():
+            if stats is not None:
+                transmitted, received = net_stats.get(vms[name], missing)
+                stats["network_transmit_KBps"] = transmitted
+                stats["network_receive_KBps"] = received
+        return results
 
     def get_vm_details(self, vm_name: str) -> Dict[str, Any]:
         """Get detailed information about a specific virtual machine."""
         self._ensure_connected()
-        vm = self.find_vm(vm_name)
-        if not vm:
-            raise Exception(f"VM {vm_name} not found")
-        
+        found = self._props_by_name(vim.VirtualMachine, [vm_name], self._VM_DETAIL_PROPERTIES).get(vm_name)
+        if found is None:
+            raise ObjectNotFound(f"VM {vm_name} not found")
+        return self._vm_details(found[1])
+
+    # Properties read by get_vm_details and get_vms_details_batch, fetched in one query
+    _VM_DETAIL_PROPERTIES = [
+        "name", "runtime.powerState", "config.guestFullName", "config.hardware.numCPU",
+        "config.hardware.memoryMB", "config.uuid", "config.instanceUuid", "config.template",
+        "config.annotation", "config.hardware.device", "guest.ipAddress", "guest.toolsStatus",
+        "guest.toolsVersion", "guest.hostName",
+    ]
+
+    @staticmethod
+    def _vm_details(props: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the get_vm_details result from fetched _VM_DETAIL_PROPERTIES values."""
+        tools_status = props.get("guest.toolsStatus")
         details = {
-            "name": vm.name,
-            "power_state": str(vm.runtime.powerState),
-            "guest_os": vm.config.guestFullName if vm.config else "Unknown",
-            "cpu_count": vm.config.hardware.numCPU if vm.config else 0,
-            "memory_mb": vm.config.hardware.memoryMB if vm.config else 0,
-            "uuid": vm.config.uuid if vm.config else None,
-            "instance_uuid": vm.config.instanceUuid if vm.config else None,
-            "ip_address": vm.guest.ipAddress if vm.guest else None,
-            "tools_status": str(vm.guest.toolsStatus) if vm.guest else "Unknown",
-            "tools_version": vm.guest.toolsVersion if vm.guest else None,
-            "hostname": vm.guest.hostName if vm.guest else None,
-            "template": vm.config.template if vm.config else False,
-            "annotation": vm.config.annotation if vm.config else "",
+            "name": props.get("name"),
+            "power_state": str(props.get("runtime.powerState")),
+            "guest_os": props.get("config.guestFullName", "Unknown"),
+            "cpu_count": props.get("config.hardware.numCPU", 0),
+            "memory_mb": props.get("config.hardware.memoryMB", 0),
+            "uuid": props.get("config.uuid"),
+            "instance_uuid": props.get("config.instanceUuid"),
+            "ip_address": props.get("guest.ipAddress"),
+            "tools_status": str(tools_status) if tools_status is not None else "Unknown",
+            "tools_version": props.get("guest.toolsVersion"),
+            "hostname": props.get("guest.hostName"),
+            "template": props.get("config.template", False),
+            "annotation": props.get("config.annotation", ""),
         }
-        
-        # Get disk information
-        if vm.config and vm.config.hardware:
+        if "config.hardware.device" in props:
+            # Disks and network adapters are collected in a single pass over the devices
             disks = []
-            for device in vm.config.hardware.device:
+            networks = []
+            for device in props["config.hardware.device"]:
                 if isinstance(device, vim.vm.device.VirtualDisk):
-                    disk_info = {
+                    disks.append({
                         "label": device.deviceInfo.label,
                         "capacity_gb": round(device.capacityInKB / (1024**2), 2),
                         "disk_mode": device.backing.diskMode if hasattr(device.backing, 'diskMode') else None,
-                    }
-                    disks.append(disk_info)
-            details["disks"] = disks
-        
-        # Get network adapter information
-        if vm.config and vm.config.hardware:
-            networks = []
-            for device in vm.config.hardware.device:
-                if isinstance(device, vim.vm.device.VirtualEthernetCard):
+                    })
+                elif isinstance(device, vim.vm.device.VirtualEthernetCard):
                     net_info = {
                         "label": device.deviceInfo.label,
                         "mac_address": device.macAddress,
@@ -321,172 +899,206 @@ class VMwareManager:
                     if hasattr(device.backing, 'deviceName'):
                         net_info["network"] = device.backing.deviceName
                     networks.append(net_info)
+            details["disks"] = disks
             details["networks"] = networks
-        
         return details
 
+    def get_vms_details_batch(self, vm_names: list) -> Dict[str, Any]:
+        """
+        Get the get_vm_details information for several VMs in at most two PropertyCollector queries.
+        
+        Returns:
+            Dict mapping each requested name to its details, or None if no such VM exists
+        """
+        self._ensure_connected()
+        resolved = self._props_by_name(vim.VirtualMachine, vm_names, self._VM_DETAIL_PROPERTIES)
+        return {name: self._vm_details(resolved[name][1]) if name in resolved else None for name in vm_names}
+
     def list_templates(self) -> list:
         """List all virtual machine templates."""
         self._ensure_connected()
-        templates = []
-        container = self.content.viewManager.CreateContainerView(self.content.rootFolder, [vim.VirtualMachine], True)
-        for vm in container.view:
-            if vm.config and vm.config.template:
-                templates.append(vm.name)
-        container.Destroy()
-        return templates
+        return [props["name"] for _, props in self._index_names(vim.VirtualMachine, ["name", "config.template"])
+                if props.get("config.template")]
 
     def list_datastores(self) -> list:
         """List all datastores with their details."""
         self._ensure_connected()
         datastores = []
-        container = self.content.viewManager.CreateContainerView(self.content.rootFolder, [vim.Datastore], True)
-        for ds in container.view:
-            ds_info = {
-                "name": ds.name,
-                "type": ds.summary.type,
-                "capacity_gb": round(ds.summary.capacity / (1024**3), 2),
-                "free_space_gb": round(ds.summary.freeSpace / (1024**3), 2),
-                "accessible": ds.summary.accessible,
-                "maintenance_mode": ds.summary.maintenanceMode if hasattr(ds.summary, 'maintenanceMode') else "normal",
-            }
-            datastores.append(ds_info)
-        container.Destroy()
+        path_set = ["name", "summary.type", "summary.capacity", "summary.freeSpace",
+                    "summary.accessible", "summary.maintenanceMode"]
+        for _, props in self._retrieve(vim.Datastore, path_set):
+            datastores.append(DatastoreInfo(
+                name=props.get("name"),
+                type=props.get("summary.type"),
+                capacity_gb=round(props.get("summary.capacity", 0) / _GIB, 2),
+                free_space_gb=round(props.get("summary.freeSpace", 0) / _GIB, 2),
+                accessible=props.get("summary.accessible"),
+                maintenance_mode=props.get("summary.maintenanceMode") or "normal",
+            ))
         return datastores
 
     def list_networks(self) -> list:
         """List all networks."""
         self._ensure_connected()
         networks = []
-        container = self.content.viewManager.CreateContainerView(self.content.rootFolder, [vim.Network], True)
-        for net in container.view:
+        # Port configuration only exists on distributed portgroups, so it is a second, typed query
+        port_configs = {
+            pg: props.get("config.defaultPortConfig")
+            for pg, props in self._retrieve(vim.dvs.DistributedVirtualPortgroup, ["config.defaultPortConfig"])
+        }
+        for net, props in self._retrieve(vim.Network, ["name", "summary.accessible"]):
             net_info = {
-                "name": net.name,
-                "accessible": net.summary.accessible if hasattr(net.summary, 'accessible') else True,
+                "name": props.get("name"),
+                "accessible": props.get("summary.accessible", True),
             }
             # Check if it's a distributed virtual portgroup
             if isinstance(net, vim.dvs.DistributedVirtualPortgroup):
+                port_config = port_configs.get(net)
+                vlan = getattr(port_config, 'vlan', None)
                 net_info["type"] = "DistributedVirtualPortgroup"
-                net_info["vlan"] = net.config.defaultPortConfig.vlan.vlanId if hasattr(net.config.defaultPortConfig, 'vlan') else None
+                net_info["vlan"] = vlan.vlanId if vlan is not None else None
             else:
                 net_info["type"] = "Network"
             networks.append(net_info)
-        container.Destroy()
         return networks
 
     def list_hosts(self) -> list:
         """List all ESXi hosts."""
         self._ensure_connected()
-        hosts = []
-        container = self.content.viewManager.CreateContainerView(self.content.rootFolder, [vim.HostSystem], True)
-        for host in container.view:
-            hosts.append(host.name)
-        container.Destroy()
-        return hosts
+        return [props["name"] for _, props in self._index_names(vim.HostSystem, ["name"])]
 
     def find_host(self, name: str) -> Optional[vim.HostSystem]:
-        """Find host object by name."""
+        """Find host object by name through the inventory-wide name index shared with list_hosts, checking its current name."""
         self._ensure_connected()
-        container = self.content.viewManager.CreateContainerView(self.content.rootFolder, [vim.HostSystem], True)
-        host_obj = None
-        for host in container.view:
-            if host.name == name:
-                host_obj = host
-                break
-        container.Destroy()
-        return host_obj
+        # A new host registered under its DNS name resolves without rebuilding the index
+        self._search_unindexed(vim.HostSystem, name,
+                               lambda: self.content.searchIndex.FindByDnsName(dnsName=name, vmSearch=False))
+        found = self._props_by_name(vim.HostSystem, [name], ["name"]).get(name)
+        return found[0] if found is not None else None
 
     def get_host_details(self, host_name: str) -> Dict[str, Any]:
         """Get detailed information about a specific host."""
         self._ensure_connected()
-        host = self.find_host(host_name)
-        if not host:
-            raise Exception(f"Host {host_name} not found")
-        
-        details = {
-            "name": host.name,
-            "connection_state": str(host.runtime.connectionState),
-            "power_state": str(host.runtime.powerState),
-            "standby_mode": str(host.runtime.standbyMode) if host.runtime.standbyMode else None,
-            "in_maintenance_mode": host.runtime.inMaintenanceMode,
-            "vendor": host.hardware.systemInfo.vendor if host.hardware else None,
-            "model": host.hardware.systemInfo.model if host.hardware else None,
-            "uuid": host.hardware.systemInfo.uuid if host.hardware else None,
-
-            "cpu_cores": host.hardware.cpuInfo.numCpuCores if host.hardware and host.hardware.cpuInfo else 0,
-            "cpu_threads": host.hardware.cpuInfo.numCpuThreads if host.hardware and host.hardware.cpuInfo else 0,
-            "cpu_mhz": host.hardware.cpuInfo.hz // 1000000 if host.hardware and host.hardware.cpuInfo else 0,
-            "memory_gb": round(host.hardware.memorySize / (1024**3), 2) if host.hardware else 0,
-            "hypervisor_version": host.config.product.version if host.config and host.config.product else None,
-            "hypervisor_build": host.config.product.build if host.config and host.config.product else None,
+        found = self._props_by_name(vim.HostSystem, [host_name], self._HOST_DETAIL_PROPERTIES).get(host_name)
+        if found is None:
+            raise ObjectNotFound(f"Host {host_name} not found")
+        return self._host_details(found[1])
+
+    # Properties read by get_host_details and get_hosts_details_batch, fetched in one query
+    _HOST_DETAIL_PROPERTIES = [
+        "name", "runtime.connectionState", "runtime.powerState", "runtime.standbyMode",
+        "runtime.inMaintenanceMode", "hardware.systemInfo.vendor", "hardware.systemInfo.model",
+        "hardware.systemInfo.uuid", "hardware.cpuInfo.numCpuCores", "hardware.cpuInfo.numCpuThreads",
+        "hardware.cpuInfo.hz", "hardware.memorySize", "config.product.version", "config.product.build",
+    ]
+
+    @staticmethod
+    def _host_details(props: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the get_host_details result from fetched _HOST_DETAIL_PROPERTIES values."""
+        standby_mode = props.get("runtime.standbyMode")
+        cpu_hz = props.get("hardware.cpuInfo.hz")
+        memory_size = props.get("hardware.memorySize")
+        return {
+            "name": props.get("name"),
+            "connection_state": str(props.get("runtime.connectionState")),
+            "power_state": str(props.get("runtime.powerState")),
+            "standby_mode": str(standby_mode) if standby_mode else None,
+            "in_maintenance_mode": props.get("runtime.inMaintenanceMode"),
+            "vendor": props.get("hardware.systemInfo.vendor"),
+            "model": props.get("hardware.systemInfo.model"),
+            "uuid": props.get("hardware.systemInfo.uuid"),
+            "cpu_cores": props.get("hardware.cpuInfo.numCpuCores", 0),
+            "cpu_threads": props.get("hardware.cpuInfo.numCpuThreads", 0),
+            "cpu_mhz": cpu_hz // 1000000 if cpu_hz is not None else 0,
+            "memory_gb": round(memory_size / _GIB, 2) if memory_size is not None else 0,
+            "hypervisor_version": props.get("config.product.version"),
+            "hypervisor_build": props.get("config.product.build"),
         }
+
+    def get_hosts_details_batch(self, host_names: list) -> Dict[str, Any]:
+        """
+        Get the get_host_details information for several hosts in at most two PropertyCollector queries.
         
-        return details
+        Returns:
+            Dict mapping each requested name to its details, or None if no such host exists
+        """
+        self._ensure_connected()
+        resolved = self._props_by_name(vim.HostSystem, host_names, self._HOST_DETAIL_PROPERTIES)
+        return {name: self._host_details(resolved[name][1]) if name in resolved else None for name in host_names}
 
     def get_host_performance_metrics(self, host_name: str) -> Dict[str, Any]:
         """Get performance metrics for a specific host."""
         self._ensure_connected()
-        host = self.find_host(host_name)
-        if not host:
-            raise Exception(f"Host {host_name} not found")
-        
-        metrics = {
-            "cpu_usage_mhz": host.summary.quickStats.overallCpuUsage if host.summary.quickStats else 0,
-            "memory_usage_mb": host.summary.quickStats.overallMemoryUsage if host.summary.quickStats else 0,
-            "uptime_seconds": host.summary.quickStats.uptime if host.summary.quickStats else 0,
-        }
+        found = self._props_by_name(vim.HostSystem, [host_name], self._HOST_QUICK_STATS_PROPERTIES).get(host_name)
+        if found is None:
+            raise ObjectNotFound(f"Host {host_name} not found")
         
-        return metrics
+        return self._host_quick_stats(found[1])
+
+    # quickStats leaves read by get_host_performance_metrics and get_host_performance
+    _HOST_QUICK_STATS_PROPERTIES = [
+        "summary.quickStats.overallCpuUsage", "summary.quickStats.overallMemoryUsage", "summary.quickStats.uptime",
+    ]
+
+    @staticmethod
+    def _host_quick_stats(props: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the basic host usage figures from fetched _HOST_QUICK_STATS_PROPERTIES values."""
+        return {
+            "cpu_usage_mhz": props.get("summary.quickStats.overallCpuUsage", 0),
+            "memory_usage_mb": props.get("summary.quickStats.overallMemoryUsage", 0),
+            "uptime_seconds": props.get("summary.quickStats.uptime", 0),
+        }
 
     def get_host_hardware_health(self, host_name: str) -> Dict[str, Any]:
         """Get hardware health information for a specific host."""
         self._ensure_connected()
-        host = self.find_host(host_name)
-        if not host:
-            raise Exception(f"Host {host_name} not found")
+        found = self._props_by_name(vim.HostSystem, [host_name], ["overallStatus", "runtime.healthSystemRuntime"]).get(host_name)
+        if found is None:
+            raise ObjectNotFound(f"Host {host_name} not found")
         
+        props = found[1]
         health = {
-            "overall_status": str(host.overallStatus),
+            "overall_status": str(props.get("overallStatus")),
             "hardware_status": [],
         }
         
         # Get hardware sensor information if available
-        if hasattr(host.runtime, 'healthSystemRuntime') and host.runtime.healthSystemRuntime:
-            health_info = host.runtime.healthSystemRuntime
-            if hasattr(health_info, 'systemHealthInfo') and health_info.systemHealthInfo:
-                sensor_info = health_info.systemHealthInfo.numericSensorInfo
-                if sensor_info:
-                    for sensor in sensor_info:
-                        sensor_data = {
-                            "name": sensor.name,
-                            "health_state": str(sensor.healthState),
-                            "current_reading": sensor.currentReading,
-                            "unit": sensor.unitModifier,
-                            "sensor_type": sensor.sensorType,
-                        }
-                        health["hardware_status"].append(sensor_data)
+        health_info = props.get("runtime.healthSystemRuntime")
+        if health_info and getattr(health_info, 'systemHealthInfo', None):
+            sensor_info = health_info.systemHealthInfo.numericSensorInfo
+            if sensor_info:
+                for sensor in sensor_info:
+                    sensor_data = {
+                        "name": sensor.name,
+                        "health_state": str(sensor.healthState),
+                        "current_reading": sensor.currentReading,
+                        "unit": sensor.unitModifier,
+                        "sensor_type": sensor.sensorType,
+                    }
+                    health["hardware_status"].append(sensor_data)
         
         return health
 
     def get_host_performance(self, host_name: str) -> Dict[str, Any]:
         """Get detailed performance data for a specific host."""
         self._ensure_connected()
-        host = self.find_host(host_name)
-        if not host:
-            raise Exception(f"Host {host_name} not found")
+        found = self._props_by_name(vim.HostSystem, [host_name], self._HOST_QUICK_STATS_PROPERTIES + [
+            "hardware.cpuInfo.numCpuCores", "hardware.cpuInfo.hz", "hardware.memorySize"]).get(host_name)
+        if found is None:
+            raise ObjectNotFound(f"Host {host_name} not found")
         
-        stats = {}
-        qs = host.summary.quickStats
+        props = found[1]
         
         # Basic performance stats
-        stats["cpu_usage_mhz"] = qs.overallCpuUsage if qs else 0
-        stats["memory_usage_mb"] = qs.overallMemoryUsage if qs else 0
-        stats["uptime_seconds"] = qs.uptime if qs else 0
+        stats = self._host_quick_stats(props)
         
         # Calculate utilization percentages
-        if host.hardware:
-            total_cpu_mhz = host.hardware.cpuInfo.numCpuCores * (host.hardware.cpuInfo.hz // 1000000) if host.hardware.cpuInfo else 0
-            total_memory_mb = host.hardware.memorySize // (1024**2) if host.hardware.memorySize else 0
+        if "hardware.cpuInfo.hz" in props or "hardware.memorySize" in props:
+            cpu_cores = props.get("hardware.cpuInfo.numCpuCores", 0)
+            cpu_hz = props.get("hardware.cpuInfo.hz", 0)
+            memory_size = props.get("hardware.memorySize")
+            total_cpu_mhz = cpu_cores * (cpu_hz // 1000000)
+            total_memory_mb = memory_size // (1024**2) if memory_size else 0
             
             stats["cpu_total_mhz"] = total_cpu_mhz
             stats["cpu_usage_percent"] = round((stats["cpu_usage_mhz"] / total_cpu_mhz * 100), 2) if total_cpu_mhz > 0 else 0
@@ -498,40 +1110,31 @@ class VMwareManager:
     def list_performance_counters(self) -> list:
         """List available performance counters."""
         self._ensure_connected()
-        counters = []
-        pm = self.content.perfManager
-        
-        for counter in pm.perfCounter:
-            counter_info = {
-                "key": counter.key,
-                "group": counter.groupInfo.key,
-                "name": counter.nameInfo.key,
-                "rollup_type": str(counter.rollupType),
-                "stats_type": str(counter.statsType),
-                "unit": counter.unitInfo.key,
-                "description": counter.nameInfo.summary if counter.nameInfo else "",
-            }
-            counters.append(counter_info)
-        
-        return counters
+        if self._counter_infos is None:
+            self._load_perf_counters()
+        # Built once per session; the records are immutable, so the list is shared
+        return self._counter_infos
 
     def get_vm_summary_stats(self, vm_name: str) -> Dict[str, Any]:
         """Get summary statistics for a virtual machine."""
         self._ensure_connected()
         vm = self.find_vm(vm_name)
         if not vm:
-            raise Exception(f"VM {vm_name} not found")
+            raise ObjectNotFound(f"VM {vm_name} not found")
         
+        props = self._fetch_props(vm, ["name", "runtime.powerState", "summary.quickStats", "summary.storage"])
+        qs = props.get("summary.quickStats")
+        storage = props.get("summary.storage")
         stats = {
-            "name": vm.name,
-            "power_state": str(vm.runtime.powerState),
-            "overall_cpu_usage_mhz": vm.summary.quickStats.overallCpuUsage if vm.summary.quickStats else 0,
-            "overall_cpu_demand_mhz": vm.summary.quickStats.overallCpuDemand if vm.summary.quickStats else 0,
-            "guest_memory_usage_mb": vm.summary.quickStats.guestMemoryUsage if vm.summary.quickStats else 0,
-            "host_memory_usage_mb": vm.summary.quickStats.hostMemoryUsage if vm.summary.quickStats else 0,
-            "uptime_seconds": vm.summary.quickStats.uptimeSeconds if vm.summary.quickStats else 0,
-            "committed_storage_gb": round(vm.summary.storage.committed / (1024**3), 2) if vm.summary.storage else 0,
-            "uncommitted_storage_gb": round(vm.summary.storage.uncommitted / (1024**3), 2) if vm.summary.storage else 0,
+            "name": props.get("name"),
+            "power_state": str(props.get("runtime.powerState")),
+            "overall_cpu_usage_mhz": qs.overallCpuUsage if qs else 0,
+            "overall_cpu_demand_mhz": qs.overallCpuDemand if qs else 0,
+            "guest_memory_usage_mb": qs.guestMemoryUsage if qs else 0,
+            "host_memory_usage_mb": qs.hostMemoryUsage if qs else 0,
+            "uptime_seconds": qs.uptimeSeconds if qs else 0,
+            "committed_storage_gb": round(storage.committed / _GIB, 2) if storage else 0,
+            "uncommitted_storage_gb": round(storage.uncommitted / _GIB, 2) if storage else 0,
         }
         
         return stats
@@ -539,9 +1142,8 @@ class VMwareManager:
     def create_vm(self, name: str, cpus: int, memory_mb: int, datastore: Optional[str] = None, network: Optional[str] = None, folder: Optional[str] = None, resource_pool: Optional[str] = None, serial_console: bool = False, datastore_cluster: Optional[str] = None) -> str:
         """Create a new virtual machine (from scratch, with an empty disk and optional network)."""
         self._ensure_connected()
-        # If a specific datastore or network is provided, update the corresponding object accordingly
-        datastore_obj = self.datastore_obj
-        network_obj = self.network_obj
+        # Use the specified datastore or network if provided; the configured defaults are
+        # only resolved when needed
         if datastore:
             datastore_obj = self.find_datastore(datastore)
             if not datastore_obj:
@@ -551,11 +1153,14 @@ class VMwareManager:
             if not pod:
                 raise Exception(f"Datastore cluster '{datastore_cluster}' not found")
             datastore_obj = self._pick_datastore_from_cluster(pod)
+        else:
+            datastore_obj = self.datastore_obj
         if network:
-            networks = self.datacenter_obj.networkFolder.childEntity
-            network_obj = next((net for net in networks if net.name == network), None)
+            network_obj = self.find_network(network)
             if not network_obj:
                 raise Exception(f"Specified network {network} not found")
+        else:
+            network_obj = self.network_obj
 
         # Build VM configuration specification
         vm_spec = vim.vm.ConfigSpec(name=name, memoryMB=memory_mb, numCPUs=cpus, guestId="otherGuest")  # guestId can be adjusted as needed
@@ -573,21 +1178,8 @@ class VMwareManager:
         controller_spec.device.key = -101
         device_specs.append(controller_spec)
 
-        # Add virtual disk
-        disk_spec = vim.vm.device.VirtualDeviceSpec()
-        disk_spec.operation = vim.vm.device.VirtualDeviceSpec.Operation.add
-        disk_spec.fileOperation = vim.vm.device.VirtualDeviceSpec.FileOperation.create
-        disk_spec.device = vim.vm.device.VirtualDisk()
-        disk_spec.device.capacityInKB = 1024 * 1024 * 10  # Create a 10GB disk
-        disk_spec.device.deviceInfo = vim.Description(label="Hard Disk 1", summary="10 GB disk")
-        disk_spec.device.backing = vim.vm.device.VirtualDisk.FlatVer2BackingInfo()
-        disk_spec.device.backing.diskMode = "persistent"
-        disk_spec.device.backing.thinProvisioned = True  # Thin provisioning
-        disk_spec.device.backing.datastore = datastore_obj
-        # Attach the disk to the previously created controller
-        disk_spec.device.controllerKey = controller_spec.device.key
-        disk_spec.device.unitNumber = 0
-        device_specs.append(disk_spec)
+        # Add a 10GB thin-provisioned disk on the previously created controller
+        device_specs.append(self._build_disk_spec(10, True, controller_spec.device.key, 0, "Hard Disk 1", datastore_obj))
 
         # If a network is provided, add a virtual network adapter
         if network_obj:
@@ -636,12 +1228,8 @@ class VMwareManager:
             pool_obj = self.resource_pool
         # Create the VM in the specified resource pool
         try:
-            task = vm_folder.CreateVM_Task(config=vm_spec, pool=pool_obj)
-            # Wait for the task to complete
-            while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-                continue
-            if task.info.state == vim.TaskInfo.State.error:
-                raise task.info.error
+            task = self._issue_task(lambda: vm_folder.CreateVM_Task(config=vm_spec, pool=pool_obj))
+            self._wait_task(task)
         except Exception as e:
             logging.error(f"Failed to create virtual machine: {e}")
             raise
@@ -684,11 +1272,8 @@ class VMwareManager:
         relocate_spec = vim.vm.RelocateSpec(pool=pool_obj, datastore=datastore_obj)
         clone_spec = vim.vm.CloneSpec(powerOn=False, template=False, location=relocate_spec)
         try:
-            task = template_vm.Clone(folder=vm_folder, name=new_name, spec=clone_spec)
-            while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-                continue
-            if task.info.state == vim.TaskInfo.State.error:
-                raise task.info.error
+            task = self._issue_task(lambda: template_vm.Clone(folder=vm_folder, name=new_name, spec=clone_spec))
+            self._wait_task(task)
         except Exception as e:
             logging.error(f"Failed to clone virtual machine: {e}")
             raise
@@ -703,9 +1288,8 @@ class VMwareManager:
                         datastore_cluster: Optional[str] = None) -> str:
         """Create a custom virtual machine with more configuration options."""
         self._ensure_connected()
-        # If a specific datastore or network is provided, update the corresponding object accordingly
-        datastore_obj = self.datastore_obj
-        network_obj = self.network_obj
+        # Use the specified datastore or network if provided; the configured defaults are
+        # only resolved when needed
         if datastore:
             datastore_obj = self.find_datastore(datastore)
             if not datastore_obj:
@@ -715,11 +1299,14 @@ class VMwareManager:
             if not pod:
                 raise Exception(f"Datastore cluster '{datastore_cluster}' not found")
             datastore_obj = self._pick_datastore_from_cluster(pod)
+        else:
+            datastore_obj = self.datastore_obj
         if network:
-            networks = self.datacenter_obj.networkFolder.childEntity
-            network_obj = next((net for net in networks if net.name == network), None)
+            network_obj = self.find_network(network)
             if not network_obj:
                 raise Exception(f"Specified network {network} not found")
+        else:
+            network_obj = self.network_obj
 
         # Build VM configuration specification
         vm_spec = vim.vm.ConfigSpec(name=name, memoryMB=memory_mb, numCPUs=cpus, guestId=guest_id)
@@ -740,19 +1327,8 @@ class VMwareManager:
         device_specs.append(controller_spec)
 
         # Add virtual disk
-        disk_spec = vim.vm.device.VirtualDeviceSpec()
-        disk_spec.operation = vim.vm.device.VirtualDeviceSpec.Operation.add
-        disk_spec.fileOperation = vim.vm.device.VirtualDeviceSpec.FileOperation.create
-        disk_spec.device = vim.vm.device.VirtualDisk()
-        disk_spec.device.capacityInKB = 1024 * 1024 * disk_size_gb
-        disk_spec.device.deviceInfo = vim.Description(label="Hard Disk 1", summary=f"{disk_size_gb} GB disk")
-        disk_spec.device.backing = vim.vm.device.VirtualDisk.FlatVer2BackingInfo()
-        disk_spec.device.backing.diskMode = "persistent"
-        disk_spec.device.backing.thinProvisioned = thin_provisioned
-        disk_spec.device.backing.datastore = datastore_obj
-        disk_spec.device.controllerKey = controller_spec.device.key
-        disk_spec.device.unitNumber = 0
-        device_specs.append(disk_spec)
+        device_specs.append(self._build_disk_spec(
+            disk_size_gb, thin_provisioned, controller_spec.device.key, 0, "Hard Disk 1", datastore_obj))
 
         # If a network is provided, add a virtual network adapter
         if network_obj:
@@ -799,64 +1375,152 @@ class VMwareManager:
         else:
             pool_obj = self.resource_pool
         try:
-            task = vm_folder.CreateVM_Task(config=vm_spec, pool=pool_obj)
-            while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-                continue
-            if task.info.state == vim.TaskInfo.State.error:
-                raise task.info.error
+            task = self._issue_task(lambda: vm_folder.CreateVM_Task(config=vm_spec, pool=pool_obj))
+            self._wait_task(task)
         except Exception as e:
             logging.error(f"Failed to create custom virtual machine: {e}")
             raise
         logging.info(f"Custom virtual machine created: {name}")
         return f"Custom VM '{name}' created with {cpus} CPUs, {memory_mb}MB RAM, and {disk_size_gb}GB disk."
 
+    @staticmethod
+    def _build_disk_spec(size_gb: int, thin_provisioned: bool, controller_key: int, unit_number: int,
+                         label: str, datastore_obj=None) -> vim.vm.device.VirtualDeviceSpec:
+        """
+        Build the device change that creates a new virtual disk on a controller.
+        
+        Without datastore_obj the disk file is placed in the VM's home directory.
+        """
+        disk_spec = vim.vm.device.VirtualDeviceSpec()
+        disk_spec.operation = vim.vm.device.VirtualDeviceSpec.Operation.add
+        disk_spec.fileOperation = vim.vm.device.VirtualDeviceSpec.FileOperation.create
+        disk_spec.device = vim.vm.device.VirtualDisk()
+        disk_spec.device.capacityInKB = 1024 * 1024 * size_gb
+        disk_spec.device.deviceInfo = vim.Description(label=label, summary=f"{size_gb} GB disk")
+        disk_spec.device.backing = vim.vm.device.VirtualDisk.FlatVer2BackingInfo()
+        disk_spec.device.backing.diskMode = "persistent"
+        disk_spec.device.backing.thinProvisioned = thin_provisioned
+        if datastore_obj is not None:
+            disk_spec.device.backing.datastore = datastore_obj
+        disk_spec.device.controllerKey = controller_key
+        disk_spec.device.unitNumber = unit_number
+        return disk_spec
+
+    def add_vm_disks(self, vm_name: str, disk_sizes_gb: list, thin_provisioned: bool = True) -> str:
+        """
+        Add several new virtual disks to a VM with a single reconfigure task.
+        
+        All disks go into one ConfigSpec.deviceChange: separate concurrent reconfigure
+        tasks on one VM serialize in vCenter and can stall each other.
+        """
+        self._ensure_connected()
+        vm = self.find_vm(vm_name)
+        if not vm:
+            raise ObjectNotFound(f"VM {vm_name} not found")
+        if not disk_sizes_gb:
+            return f"No disks to add to VM '{vm_name}'"
+
+        devices = self._fetch_props(vm, ["config.hardware.device"]).get("config.hardware.device", [])
+        controllers = [d for d in devices if isinstance(d, vim.vm.device.VirtualSCSIController)]
+        if not controllers:
+            raise Exception(f"VM '{vm_name}' has no SCSI controller to attach disks to")
+        controller = min(controllers, key=lambda d: d.busNumber)
+        # Unit 7 is reserved for the SCSI controller itself
+        used_units = {d.unitNumber for d in devices if d.controllerKey == controller.key}
+        used_units.add(7)
+        free_units = [unit for unit in range(16) if unit not in used_units]
+        if len(free_units) < len(disk_sizes_gb):
+            raise Exception(
+                f"SCSI controller of VM '{vm_name}' has only {len(free_units)} free slots "
+                f"for {len(disk_sizes_gb)} disks")
+        disk_count = sum(1 for d in devices if isinstance(d, vim.vm.device.VirtualDisk))
+
+        config_spec = vim.vm.ConfigSpec()
+        config_spec.deviceChange = [
+            self._build_disk_spec(size_gb, thin_provisioned, controller.key, unit, f"Hard Disk {disk_count + i + 1}")
+            for i, (size_gb, unit) in enumerate(zip(disk_sizes_gb, free_units))
+        ]
+        task = self._issue_task(lambda: vm.ReconfigVM_Task(spec=config_spec))
+        self._wait_task(task)
+
+        logging.info(f"Added {len(disk_sizes_gb)} disks to VM '{vm_name}'")
+        return f"Added {len(disk_sizes_gb)} disks to VM '{vm_name}'"
+
     def delete_vm(self, name: str) -> str:
         """Delete the specified virtual machine."""
         self._ensure_connected()
         vm = self.find_vm(name)
         if not vm:
-            raise Exception(f"Virtual machine {name} not found")
+            raise ObjectNotFound(f"Virtual machine {name} not found")
         try:
-            task = vm.Destroy_Task()
-            while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-                continue
-            if task.info.state == vim.TaskInfo.State.error:
-                raise task.info.error
+            task = self._issue_task(vm.Destroy_Task)
+            self._wait_task(task)
         except Exception as e:
             logging.error(f"Failed to delete virtual machine: {e}")
             raise
+        # The deleted VM's reference must not be served from the name index
+        self._name_index.pop((vim.VirtualMachine, None), None)
+        self._snapshot_index.pop(vm._moId, None)
         logging.info(f"Virtual machine deleted: {name}")
         return f"VM '{name}' deleted."
 
-    def power_on_vm(self, name: str) -> str:
-        """Power on the specified virtual machine."""
+    def power_on_vm(self, name: str, wait: bool = True) -> str:
+        """
+        Power on the specified virtual machine.
+        
+        With wait=False the call returns as soon as vCenter accepts the task; pass the
+        reported task id to join_tasks to collect the outcome.
+        """
         self._ensure_connected()
         vm = self.find_vm(name)
         if not vm:
-            raise Exception(f"Virtual machine {name} not found")
-        if vm.runtime.powerState == vim.VirtualMachine.PowerState.poweredOn:
-            return f"VM '{name}' is already powered on."
-        task = vm.PowerOnVM_Task()
-        while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-            continue
-        if task.info.state == vim.TaskInfo.State.error:
-            raise task.info.error
+            raise ObjectNotFound(f"Virtual machine {name} not found")
+        already = f"VM '{name}' is already powered on."
+        if not wait:
+            # Checked up front, since the task's outcome is not seen here
+            if self._fetch_props(vm, ["runtime.powerState"]).get("runtime.powerState") == vim.VirtualMachine.PowerState.poweredOn:
+                return already
+            task = self._issue_task(vm.PowerOnVM_Task, vm, "power_on", self.config.host_power_on_limit)
+            return f"VM '{name}' power on started as task {task._moId}."
+        # Issued without reading the power state first; vCenter rejects a VM already in
+        # the target state with InvalidPowerState, which saves a round-trip per call
+        try:
+            task = self._issue_task(vm.PowerOnVM_Task, vm, "power_on", self.config.host_power_on_limit)
+            self._wait_task(task)
+        except vim.fault.InvalidPowerState as e:
+            if e.existingState == vim.VirtualMachine.PowerState.poweredOn:
+                return already
+            raise
         logging.info(f"Virtual machine powered on: {name}")
         return f"VM '{name}' powered on."
 
-    def power_off_vm(self, name: str) -> str:
-        """Power off the specified virtual machine."""
+    def power_off_vm(self, name: str, wait: bool = True) -> str:
+        """
+        Power off the specified virtual machine.
+        
+        With wait=False the call returns as soon as vCenter accepts the task; pass the
+        reported task id to join_tasks to collect the outcome.
+        """
         self._ensure_connected()
         vm = self.find_vm(name)
         if not vm:
-            raise Exception(f"Virtual machine {name} not found")
-        if vm.runtime.powerState == vim.VirtualMachine.PowerState.poweredOff:
-            return f"VM '{name}' is already powered off."
-        task = vm.PowerOffVM_Task()
-        while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-            continue
-        if task.info.state == vim.TaskInfo.State.error:
-            raise task.info.error
+            raise ObjectNotFound(f"Virtual machine {name} not found")
+        already = f"VM '{name}' is already powered off."
+        if not wait:
+            # Checked up front, since the task's outcome is not seen here
+            if self._fetch_props(vm, ["runtime.powerState"]).get("runtime.powerState") == vim.VirtualMachine.PowerState.poweredOff:
+                return already
+            task = self._issue_task(vm.PowerOffVM_Task)
+            return f"VM '{name}' power off started as task {task._moId}."
+        # Issued without reading the power state first; vCenter rejects a VM already in
+        # the target state with InvalidPowerState, which saves a round-trip per call
+        try:
+            task = self._issue_task(vm.PowerOffVM_Task)
+            self._wait_task(task)
+        except vim.fault.InvalidPowerState as e:
+            if e.existingState == vim.VirtualMachine.PowerState.poweredOff:
+                return already
+            raise
         logging.info(f"Virtual machine powered off: {name}")
         return f"VM '{name}' powered off."
 
@@ -864,42 +1528,179 @@ class VMwareManager:
         """List all datastore clusters (StoragePods)."""
         self._ensure_connected()
         clusters = []
-        container = self.content.viewManager.CreateContainerView(
-            self.content.rootFolder, [vim.StoragePod], True)
-        for pod in container.view:
-            cluster_info = {
-                "name": pod.name,
-                "capacity_gb": round(pod.summary.capacity / (1024**3), 2) if pod.summary else 0,
-                "free_space_gb": round(pod.summary.freeSpace / (1024**3), 2) if pod.summary else 0,
-                "datastores": [ds.name for ds in pod.childEntity if isinstance(ds, vim.Datastore)]
-            }
-            clusters.append(cluster_info)
-        container.Destroy()
+        pods = self._retrieve(vim.StoragePod, ["name", "summary.capacity", "summary.freeSpace", "childEntity"])
+        if not pods:
+            return clusters
+        # Names of the member datastores only, in one query instead of one fetch per member
+        members = [ds for _, props in pods for ds in props.get("childEntity", []) if isinstance(ds, vim.Datastore)]
+        datastore_names = {ds: props.get("name") for ds, props in self._retrieve(vim.Datastore, ["name"], members)}
+        for _, props in pods:
+            clusters.append(DatastoreClusterInfo(
+                name=props.get("name"),
+                capacity_gb=round(props.get("summary.capacity", 0) / _GIB, 2),
+                free_space_gb=round(props.get("summary.freeSpace", 0) / _GIB, 2),
+                datastores=[datastore_names[ds] for ds in props.get("childEntity", [])
+                            if isinstance(ds, vim.Datastore) and ds in datastore_names]
+            ))
         return clusters
 
+    def _watch_task(self, task: vim.Task, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Block until a vCenter task finishes or timeout seconds pass, without polling.
+        
+        The task is registered with the session's shared _TaskWatcher, so waiting
+        costs a Future rather than a PropertyCollector and round-trips of its own.
+        
+        Returns:
+            The latest "info.state", "info.error" and "info.result" values seen; the
+            state is still queued or running if the timeout expired
+        """
+        future = self._task_watcher().watch(task)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            return {"info.state": task.info.state}
+
+    def _task_watcher(self) -> "_TaskWatcher":
+        """Return the task watcher of the current session, creating it on first use."""
+        with self._task_watcher_lock:
+            watcher = self._task_watcher_obj
+            if watcher is None or watcher.epoch != self.connection_epoch:
+                watcher = self._task_watcher_obj = _TaskWatcher(
+                    self.content.propertyCollector.CreatePropertyCollector(), self.connection_epoch)
+            return watcher
+
+    def _issue_task(self, start: Callable[[], vim.Task], vm: Optional[vim.VirtualMachine] = None,
+                    operation: Optional[str] = None, limit: int = 0) -> vim.Task:
+        """
+        Start a vCenter task by calling start() within the client-side task caps and return it.
+        
+        Every task holds one of config.max_concurrent_tasks slots; with an operation and
+        a positive limit it also holds one of limit slots for that operation on the VM's
+        host. vCenter queues tasks beyond its per-host limits (e.g. 10 concurrent
+        snapshots) and serves them one by one, so capping them here keeps bulk calls at
+        the highest concurrency the host accepts. Slots are released by the session's
+        task watcher once the task finishes, so tasks started with wait=False or whose
+        wait timed out stay counted while they run.
+        """
+        slots = []
+        if operation is not None and limit > 0:
+            # Taken before the global slot, so calls queued on a busy host do not hold one
+            slots.append(self._host_slot(vm, operation, limit))
+        if self._task_slots is not None:
+            slots.append(self._task_slots)
+        for slot in slots:
+            slot.acquire()
+        try:
+            task = start()
+            future = self._task_watcher().watch(task)
+        except BaseException:
+            for slot in reversed(slots):
+                slot.release()
+            raise
+        
+        def release(_future):
+            for slot in reversed(slots):
+                slot.release()
+        
+        future.add_done_callback(release)
+        return task
+
+    def _host_slot(self, vm: vim.VirtualMachine, operation: str, limit: int) -> threading.BoundedSemaphore:
+        """Return the semaphore capping operation's tasks on the VM's host at limit."""
+        # Known from the name index that resolved the VM; only looked up if it was resolved otherwise
+        host = self._vm_hosts.get(vm, _UNRESOLVED)
+        if host is _UNRESOLVED:
+            host = self._fetch_props(vm, ["runtime.host"]).get("runtime.host")
+        key = (operation, host._moId if host is not None else None)
+        slot = self._host_slots.get(key)
+        if slot is None:
+            with self._host_slots_lock:
+                slot = self._host_slots.setdefault(key, threading.BoundedSemaphore(limit))
+        return slot
+
+    def _wait_task(self, task: vim.Task):
+        """
+        Block until a vCenter task finishes and return its result.
+        
+        Raises:
+            The task's info.error if the task failed
+            TimeoutError: If the task is still running after config.task_timeout seconds
+        """
+        timeout = self.config.task_timeout or None
+        info = self._watch_task(task, timeout)
+        state = info.get("info.state")
+        if state == vim.TaskInfo.State.error:
+            raise info.get("info.error") or Exception("Task failed")
+        if state != vim.TaskInfo.State.success:
+            raise TimeoutError(f"vCenter task {task._moId} still {state} after {timeout} seconds")
+        return info.get("info.result")
+
     def wait_for_task(self, task: vim.Task, timeout: int = 300) -> Dict[str, Any]:
         """Wait for a vCenter task to complete or timeout."""
-        start_time = time.time()
-        while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-            if time.time() - start_time > timeout:
-                return {
-                    "status": "timeout",
-                    "message": f"Task timed out after {timeout} seconds",
-                    "task_state": str(task.info.state)
-                }
-            time.sleep(1)
+        return self._task_outcome(self._watch_task(task, timeout), timeout)
+
+    def join_tasks(self, task_ids: list, timeout: int = 300) -> Dict[str, Any]:
+        """
+        Wait for several vCenter tasks at once, e.g. ones started with wait=False.
+        
+        All tasks are watched by the session's shared task watcher, so the call takes as
+        long as the slowest task (or timeout), not the sum of their durations.
         
-        if task.info.state == vim.TaskInfo.State.success:
+        Returns:
+            Dict mapping each task id to its outcome, as returned by wait_for_task
+        """
+        self._ensure_connected()
+        watcher = self._task_watcher()
+        deadline = time.monotonic() + timeout
+        results = {}
+        try:
+            # One filter for the whole batch
+            futures = dict(zip(task_ids, watcher.watch_many([vim.Task(task_id, self.si._stub) for task_id in task_ids])))
+        except vmodl.fault.ManagedObjectNotFound:
+            # Some id is stale or mistyped; watch one by one to report just those
+            futures = {}
+            for task_id in task_ids:
+                try:
+                    futures[task_id] = watcher.watch(vim.Task(task_id, self.si._stub))
+                except vmodl.fault.ManagedObjectNotFound:
+                    results[task_id] = {"status": "error", "message": f"Task {task_id} not found", "error": None}
+        unfinished = []
+        for task_id, future in futures.items():
+            try:
+                results[task_id] = self._task_outcome(future.result(max(deadline - time.monotonic(), 0)), timeout)
+            except FutureTimeoutError:
+                unfinished.append(task_id)
+        if unfinished:
+            # Current states of the tasks still running, in one query
+            states = self._retrieve(vim.Task, ["info.state"], [vim.Task(task_id, self.si._stub) for task_id in unfinished])
+            for task, props in states:
+                results[task._moId] = self._task_outcome(props, timeout)
+        return results
+
+    @staticmethod
+    def _task_outcome(info: Dict[str, Any], timeout: int) -> Dict[str, Any]:
+        """Describe the info values of a watched task as a success, error or timeout outcome."""
+        state = info.get("info.state")
+        if state == vim.TaskInfo.State.success:
+            result = info.get("info.result")
             return {
                 "status": "success",
                 "message": "Task completed successfully",
-                "result": str(task.info.result) if task.info.result else None
+                "result": str(result) if result else None
             }
-        else:
+        elif state == vim.TaskInfo.State.error:
+            error = info.get("info.error")
             return {
                 "status": "error",
-                "message": str(task.info.error) if task.info.error else "Unknown error",
-                "error": str(task.info.error) if task.info.error else None
+                "message": str(error) if error else "Unknown error",
+                "error": str(error) if error else None
+            }
+        else:
+            return {
+                "status": "timeout",
+                "message": f"Task timed out after {timeout} seconds",
+                "task_state": str(state)
             }
 
     def create_snapshot(self, vm_name: str, snapshot_name: str, description: str = "",
@@ -908,13 +1709,14 @@ class VMwareManager:
         self._ensure_connected()
         vm = self.find_vm(vm_name)
         if not vm:
-            raise Exception(f"VM {vm_name} not found")
+            raise ObjectNotFound(f"VM {vm_name} not found")
         
-        task = vm.CreateSnapshot(snapshot_name, description, memory, quiesce)
-        while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-            continue
-        if task.info.state == vim.TaskInfo.State.error:
-            raise task.info.error
+        task = self._issue_task(lambda: vm.CreateSnapshot(snapshot_name, description, memory, quiesce),
+                                vm, "snapshot", self.config.host_snapshot_limit)
+        try:
+            self._wait_task(task)
+        finally:
+            self._snapshot_index.pop(vm._moId, None)
         
         logging.info(f"Snapshot '{snapshot_name}' created for VM '{vm_name}'")
         return f"Snapshot '{snapshot_name}' created successfully for VM '{vm_name}'"
@@ -924,20 +1726,15 @@ class VMwareManager:
         self._ensure_connected()
         vm = self.find_vm(vm_name)
         if not vm:
-            raise Exception(f"VM {vm_name} not found")
+            raise ObjectNotFound(f"VM {vm_name} not found")
         
-        if not vm.snapshot:
-            raise Exception(f"VM {vm_name} has no snapshots")
-        
-        snapshot = self._find_snapshot_by_name(vm.snapshot.rootSnapshotList, snapshot_name)
-        if not snapshot:
-            raise Exception(f"Snapshot '{snapshot_name}' not found on VM '{vm_name}'")
+        snapshot = self._find_vm_snapshot(vm, vm_name, snapshot_name)
         
-        task = snapshot.snapshot.RemoveSnapshot_Task(remove_children)
-        while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-            continue
-        if task.info.state == vim.TaskInfo.State.error:
-            raise task.info.error
+        task = self._issue_task(lambda: snapshot.snapshot.RemoveSnapshot_Task(remove_children))
+        try:
+            self._wait_task(task)
+        finally:
+            self._snapshot_index.pop(vm._moId, None)
         
         logging.info(f"Snapshot '{snapshot_name}' removed from VM '{vm_name}'")
         return f"Snapshot '{snapshot_name}' removed successfully from VM '{vm_name}'"
@@ -947,20 +1744,12 @@ class VMwareManager:
         self._ensure_connected()
         vm = self.find_vm(vm_name)
         if not vm:
-            raise Exception(f"VM {vm_name} not found")
+            raise ObjectNotFound(f"VM {vm_name} not found")
         
-        if not vm.snapshot:
-            raise Exception(f"VM {vm_name} has no snapshots")
-        
-        snapshot = self._find_snapshot_by_name(vm.snapshot.rootSnapshotList, snapshot_name)
-        if not snapshot:
-            raise Exception(f"Snapshot '{snapshot_name}' not found on VM '{vm_name}'")
+        snapshot = self._find_vm_snapshot(vm, vm_name, snapshot_name)
         
-        task = snapshot.snapshot.RevertToSnapshot_Task()
-        while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-            continue
-        if task.info.state == vim.TaskInfo.State.error:
-            raise task.info.error
+        task = self._issue_task(snapshot.snapshot.RevertToSnapshot_Task)
+        self._wait_task(task)
         
         logging.info(f"VM '{vm_name}' reverted to snapshot '{snapshot_name}'")
         return f"VM '{vm_name}' reverted successfully to snapshot '{snapshot_name}'"
@@ -970,13 +1759,15 @@ class VMwareManager:
         self._ensure_connected()
         vm = self.find_vm(vm_name)
         if not vm:
-            raise Exception(f"VM {vm_name} not found")
+            raise ObjectNotFound(f"VM {vm_name} not found")
         
-        if not vm.snapshot:
+        # Only the tree, in one fetch, rather than vm.snapshot once for the check and again for the list
+        roots = self._fetch_props(vm, ["snapshot.rootSnapshotList"]).get("snapshot.rootSnapshotList")
+        if not roots:
             return []
         
         snapshots = []
-        self._collect_snapshots(vm.snapshot.rootSnapshotList, snapshots)
+        self._collect_snapshots(roots, snapshots)
         return snapshots
 
     def remove_all_snapshots(self, vm_name: str) -> str:
@@ -984,44 +1775,72 @@ class VMwareManager:
         self._ensure_connected()
         vm = self.find_vm(vm_name)
         if not vm:
-            raise Exception(f"VM {vm_name} not found")
+            raise ObjectNotFound(f"VM {vm_name} not found")
         
-        if not vm.snapshot:
+        # The root snapshot references are enough to tell; the tree itself is not needed
+        if not self._fetch_props(vm, ["rootSnapshot"]).get("rootSnapshot"):
             return f"VM '{vm_name}' has no snapshots to remove"
         
-        task = vm.RemoveAllSnapshots()
-        while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-            continue
-        if task.info.state == vim.TaskInfo.State.error:
-            raise task.info.error
+        task = self._issue_task(vm.RemoveAllSnapshots)
+        try:
+            self._wait_task(task)
+        finally:
+            self._snapshot_index.pop(vm._moId, None)
         
         logging.info(f"All snapshots removed from VM '{vm_name}'")
         return f"All snapshots removed successfully from VM '{vm_name}'"
 
-    def _find_snapshot_by_name(self, snapshots, name: str):
-        """Recursively find a snapshot by name."""
-        for snapshot in snapshots:
-            if snapshot.name == name:
-                return snapshot
+    def _index_snapshots(self, vm: vim.VirtualMachine) -> Dict[str, Any]:
+        """Walk a VM's snapshot tree once and map each name to its first depth-first SnapshotTree node."""
+        now = time.monotonic()
+        snapshot_info = vm.snapshot
+        index = {}
+        stack = list(reversed(snapshot_info.rootSnapshotList)) if snapshot_info else []
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            snapshot = pop()
+            index.setdefault(snapshot.name, snapshot)
             if snapshot.childSnapshotList:
-                result = self._find_snapshot_by_name(snapshot.childSnapshotList, name)
-                if result:
-                    return result
-        return None
+                # Reversed so the first child is visited next, as in a recursive walk
+                extend(reversed(snapshot.childSnapshotList))
+        self._snapshot_index[vm._moId] = (now, index)
+        return index
+
+    def _find_vm_snapshot(self, vm: vim.VirtualMachine, vm_name: str, snapshot_name: str):
+        """
+        Return the SnapshotTree node named snapshot_name of a VM.
+        
+        The name index is reused for config.index_ttl seconds, so operating on several
+        snapshots of one VM walks its tree once; a miss re-reads the tree first.
+        """
+        entry = self._snapshot_index.get(vm._moId)
+        if entry is not None and time.monotonic() - entry[0] < self.config.index_ttl:
+            snapshot = entry[1].get(snapshot_name)
+            if snapshot is not None:
+                return snapshot
+        index = self._index_snapshots(vm)
+        if not index:
+            raise Exception(f"VM {vm_name} has no snapshots")
+        snapshot = index.get(snapshot_name)
+        if snapshot is None:
+            raise Exception(f"Snapshot '{snapshot_name}' not found on VM '{vm_name}'")
+        return snapshot
 
     def _collect_snapshots(self, snapshots, result: list, level: int = 0):
-        """Recursively collect snapshot information."""
-        for snapshot in snapshots:
-            snap_info = {
-                "name": snapshot.name,
-                "description": snapshot.description,
-                "create_time": str(snapshot.createTime),
-                "state": str(snapshot.state),
-                "level": level
-            }
-            result.append(snap_info)
+        """Collect snapshot information depth-first, each snapshot followed by its children."""
+        stack = [(snapshot, level) for snapshot in reversed(snapshots)]
+        pop, append = stack.pop, result.append
+        while stack:
+            snapshot, depth = pop()
+            append(SnapshotInfo(
+                name=snapshot.name,
+                description=snapshot.description,
+                create_time=str(snapshot.createTime),
+                state=str(snapshot.state),
+                level=depth
+            ))
             if snapshot.childSnapshotList:
-                self._collect_snapshots(snapshot.childSnapshotList, result, level + 1)
+                stack.extend((child, depth + 1) for child in reversed(snapshot.childSnapshotList))
 
     def execute_program_in_vm(self, vm_name: str, program_path: str,
                              program_arguments: str = "",
@@ -1032,7 +1851,7 @@ class VMwareManager:
 
         vm = self.find_vm(vm_name)
         if not vm:
-            raise Exception(f"VM {vm_name} not found")
+            raise ObjectNotFound(f"VM {vm_name} not found")
 
         # Check VMware Tools status
         tools_status = vm.guest.toolsStatus
@@ -1061,10 +1880,13 @@ class VMwareManager:
         if pid > 0:
             logging.info(f"Program started in VM '{vm_name}', PID: {pid}")
             
-            # Wait for program to complete (with timeout)
+            # Wait for program to complete (with timeout). Guest processes are not managed
+            # objects, so there is nothing to subscribe to; poll with a growing interval so
+            # short commands are seen quickly and long ones cost few calls
             max_wait = 30  # seconds
-            wait_count = 0
-            while wait_count < max_wait:
+            deadline = time.monotonic() + max_wait
+            delay = 0.05
+            while True:
                 processes = process_manager.ListProcessesInGuest(vm, creds, [pid])
                 if processes:
                     exit_code = processes[0].exitCode
@@ -1076,8 +1898,11 @@ class VMwareManager:
                             "status": "completed",
                             "success": exit_code == 0
                         }
-                time.sleep(1)
-                wait_count += 1
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 1.5, 2.0)
             
             return {
                 "pid": pid,
@@ -1093,11 +1918,10 @@ class VMwareManager:
                          password: str = None) -> str:
         """Upload a file to a VM using VMware Tools."""
         self._ensure_connected()
-        import requests
 
         vm = self.find_vm(vm_name)
         if not vm:
-            raise Exception(f"VM {vm_name} not found")
+            raise ObjectNotFound(f"VM {vm_name} not found")
 
         # Check VMware Tools status
         tools_status = vm.guest.toolsStatus
@@ -1107,9 +1931,8 @@ class VMwareManager:
 
         creds = self._get_guest_credentials(username, password)
         
-        # Read the local file
-        with open(local_file_path, 'rb') as f:
-            file_data = f.read()
+        # Only the size is needed up front; the content is streamed during the upload
+        file_size = os.path.getsize(local_file_path)
         
         # Get file manager
         file_manager = self.content.guestOperationsManager.fileManager
@@ -1119,13 +1942,16 @@ class VMwareManager:
         
         # Initiate file transfer
         url = file_manager.InitiateFileTransferToGuest(
-            vm, creds, remote_file_path, file_attribute, len(file_data), True)
+            vm, creds, remote_file_path, file_attribute, file_size, True)
         
         # Fix the URL (replace wildcard with actual host)
-        url = re.sub(r"^https://\*:", f"https://{self.config.vcenter_host}:", url)
+        if url.startswith("https://*:"):
+            url = f"https://{self.config.vcenter_host}:" + url[len("https://*:"):]
         
-        # Upload the file
-        resp = requests.put(url, data=file_data, verify=False)
+        # Upload the file, streaming it from disk rather than holding it in memory
+        with open(local_file_path, 'rb') as file_data:
+            resp = self._http_session().put(
+                url, data=file_data, headers={'Content-Length': str(file_size)})
         
         if resp.status_code == 200:
             logging.info(f"File uploaded to VM '{vm_name}': {remote_file_path}")
@@ -1137,17 +1963,9 @@ class VMwareManager:
                                  remote_file_path: str) -> str:
         """Upload a file to a datastore."""
         self._ensure_connected()
-        import requests
 
         # Find the datastore
-        datastore = None
-        container = self.content.viewManager.CreateContainerView(
-            self.content.rootFolder, [vim.Datastore], True)
-        for ds in container.view:
-            if ds.name == datastore_name:
-                datastore = ds
-                break
-        container.Destroy()
+        datastore = self.find_datastore(datastore_name)
         
         if not datastore:
             raise Exception(f"Datastore '{datastore_name}' not found")
@@ -1158,23 +1976,25 @@ class VMwareManager:
         
         resource = "/folder" + remote_file_path
         params = {
-            "dsName": datastore.name,
+            "dsName": datastore_name,  # The index matched this exact name; no need to fetch it again
             "dcPath": self.datacenter_obj.name
         }
         http_url = f"https://{self.config.vcenter_host}:443{resource}"
         
         # Set headers
-        headers = {'Content-Type': 'application/octet-stream'}
+        headers = {
+            'Content-Type': 'application/octet-stream',
+            'Content-Length': str(os.path.getsize(local_file_path)),
+        }
 
-        # Upload the file
+        # Upload the file, streaming it from disk
         with open(local_file_path, "rb") as file_data:
-            resp = requests.put(
+            resp = self._http_session().put(
                 http_url,
                 params=params,
                 data=file_data,
                 headers=headers,
-                cookies=self._get_session_cookies(),
-                verify=False
+                cookies=self._get_session_cookies()
             )
         
         if resp.status_code in (200, 201):
@@ -1187,9 +2007,6 @@ class VMwareManager:
                    datastore_name: str = None, resource_pool_name: str = None) -> str:
         """Deploy a VM from OVF and VMDK files."""
         self._ensure_connected()
-        import os
-        from threading import Thread
-        from time import sleep
 
         # Read OVF descriptor
         if not os.path.exists(ovf_path):
@@ -1199,27 +2016,19 @@ class VMwareManager:
             ovf_descriptor = f.read()
         
         # Determine datastore
-        datastore = self.datastore_obj
         if datastore_name:
-            datastore = None
-            for ds in self.datacenter_obj.datastoreFolder.childEntity:
-                if isinstance(ds, vim.Datastore) and ds.name == datastore_name:
-                    datastore = ds
-                    break
+            datastore = self.find_datastore(datastore_name)
             if not datastore:
                 raise Exception(f"Datastore '{datastore_name}' not found")
+        else:
+            datastore = self.datastore_obj
         
         # Determine resource pool
-        resource_pool = self.resource_pool
+        resource_pool = None
         if resource_pool_name:
             # Search for specific resource pool
-            container = self.content.viewManager.CreateContainerView(
-                self.datacenter_obj, [vim.ResourcePool], True)
-            for rp in container.view:
-                if rp.name == resource_pool_name:
-                    resource_pool = rp
-                    break
-            container.Destroy()
+            resource_pool = self.find_resource_pool(resource_pool_name)
+        resource_pool = resource_pool or self.resource_pool
         
         # Create import spec
         ovf_manager = self.content.ovfManager
@@ -1241,7 +2050,7 @@ class VMwareManager:
         
         # Wait for lease to be ready
         while lease.state == vim.HttpNfcLease.State.initializing:
-            sleep(1)
+            time.sleep(1)
         
         if lease.state == vim.HttpNfcLease.State.error:
             raise Exception(f"Lease error: {lease.error}")
@@ -1252,18 +2061,17 @@ class VMwareManager:
             
             def keep_lease_alive(lease_obj):
                 while lease_obj.state not in [vim.HttpNfcLease.State.done, vim.HttpNfcLease.State.error]:
-                    sleep(5)
+                    time.sleep(5)
                     try:
                         lease_obj.HttpNfcLeaseProgress(50)
                     except:
                         return
             
             # Start keepalive thread
-            keepalive_thread = Thread(target=keep_lease_alive, args=(lease,))
+            keepalive_thread = threading.Thread(target=keep_lease_alive, args=(lease,))
             keepalive_thread.start()
             
             # Upload VMDK file
-            import subprocess
             curl_cmd = [
                 "curl", "-Ss", "-X", "POST", "--insecure",
                 "-T", vmdk_path,
@@ -1287,11 +2095,6 @@ class VMwareManager:
                    datastore_name: str = None, resource_pool_name: str = None) -> str:
         """Deploy a VM from an OVA file."""
         self._ensure_connected()
-        import os
-        import tarfile
-        import ssl
-        from threading import Timer
-        from six.moves.urllib.request import Request, urlopen
 
         # Check if OVA exists
         if not os.path.exists(ova_path):
@@ -1313,26 +2116,18 @@ class VMwareManager:
         ovf_descriptor = ovf_file.read().decode()
         
         # Determine datastore
-        datastore = self.datastore_obj
         if datastore_name:
-            datastore = None
-            for ds in self.datacenter_obj.datastoreFolder.childEntity:
-                if isinstance(ds, vim.Datastore) and ds.name == datastore_name:
-                    datastore = ds
-                    break
+            datastore = self.find_datastore(datastore_name)
             if not datastore:
                 raise Exception(f"Datastore '{datastore_name}' not found")
+        else:
+            datastore = self.datastore_obj
         
         # Determine resource pool
-        resource_pool = self.resource_pool
+        resource_pool = None
         if resource_pool_name:
-            container = self.content.viewManager.CreateContainerView(
-                self.datacenter_obj, [vim.ResourcePool], True)
-            for rp in container.view:
-                if rp.name == resource_pool_name:
-                    resource_pool = rp
-                    break
-            container.Destroy()
+            resource_pool = self.find_resource_pool(resource_pool_name)
+        resource_pool = resource_pool or self.resource_pool
         
         # Create import spec
         ovf_manager = self.content.ovfManager
@@ -1374,42 +2169,35 @@ class VMwareManager:
                     return
         
         # Start keepalive
-        keepalive_timer = Timer(5, keep_lease_alive, args=(lease,))
+        keepalive_timer = threading.Timer(5, keep_lease_alive, args=(lease,))
         keepalive_timer.start()
         
+        def upload_disk(file_item, device_url):
+            # Each upload reads through its own TarFile, since one TarFile cannot be shared between threads
+            with tarfile.open(ova_path) as disk_tar:
+                member = disk_tar.getmember(file_item.path)
+                disk_file = disk_tar.extractfile(member)
+                url = device_url.url.replace('*', self.config.vcenter_host)
+                headers = {'Content-length': str(member.size)}
+                req = Request(url, disk_file, headers)
+                urlopen(req, context=_INSECURE_SSL_CONTEXT)
+        
         try:
-            # Upload each disk file
-            for file_item in import_spec.fileItem:
-                # Find disk in tarball
-                disk_file = None
-                for member in tar.getmembers():
-                    if member.name == file_item.path:
-                        disk_file = tar.extractfile(member)
-                        break
-                
-                if disk_file:
-                    # Find device URL
-                    device_url = None
-                    for dev_url in lease.info.deviceUrl:
-                        if dev_url.importKey == file_item.deviceId:
-                            device_url = dev_url
-                            break
-                    
-                    if device_url:
-                        url = device_url.url.replace('*', self.config.vcenter_host)
-                        
-                        # Get file size
-                        file_size = member.size
-                        
-                        # Upload
-                        headers = {'Content-length': str(file_size)}
-                        if hasattr(ssl, '_create_unverified_context'):
-                            ssl_context = ssl._create_unverified_context()
-                        else:
-                            ssl_context = None
-                        
-                        req = Request(url, disk_file, headers)
-                        urlopen(req, context=ssl_context)
+            # Pair each disk in the tarball with its device URL
+            tar_members = {member.name for member in tar.getmembers()}
+            device_urls = {dev_url.importKey: dev_url for dev_url in lease.info.deviceUrl}
+            uploads = [(file_item, device_urls[file_item.deviceId])
+                       for file_item in import_spec.fileItem
+                       if file_item.path in tar_members and file_item.deviceId in device_urls]
+            
+            # Upload the disks concurrently
+            if uploads:
+                with ThreadPoolExecutor(max_workers=min(len(uploads), 4),
+                                        thread_name_prefix="ova-upload") as pool:
+                    futures = [pool.submit(upload_disk, file_item, device_url)
+                               for file_item, device_url in uploads]
+                    for future in futures:
+                        future.result()
             
             lease.Complete()
             keepalive_timer.cancel()
@@ -1425,98 +2213,92 @@ class VMwareManager:
             raise Exception(f"Failed to deploy OVA: {str(ex)}")
 
     def wait_for_updates(self, object_type: str, properties: list,
-                        max_wait_seconds: int = 30, max_iterations: int = 1) -> Dict[str, Any]:
-        """Wait for property updates on vSphere objects."""
+                        max_wait_seconds: int = 30, max_iterations: int = 1,
+                        version: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Wait for property updates on vSphere objects.
+        
+        Updates come from a persistent subscription per (object_type, properties).
+        Without a version, the current state of every matching object is returned as
+        "enter" updates. Pass the returned version back to receive only updates after
+        that call; if they are no longer buffered (or the version belongs to an
+        expired subscription), "resync" is set and the current state is returned instead.
+        """
         self._ensure_connected()
-        from pyVmomi import vmodl
         
         # Parse object type
-        try:
-            mo_type = getattr(vim, object_type, None)
-            if mo_type is None:
-                raise Exception(f"Invalid object type: {object_type}")
-        except:
+        mo_type = getattr(vim, object_type, None)
+        if mo_type is None:
             raise Exception(f"Invalid object type: {object_type}")
         
-        # Create property filter spec
-        filter_spec = vmodl.query.PropertyCollector.FilterSpec()
-        
-        # Create object spec with traversal
-        obj_spec = vmodl.query.PropertyCollector.ObjectSpec(
-            obj=self.content.rootFolder,
-            selectSet=self._build_traversal_spec()
-        )
-        filter_spec.objectSet = [obj_spec]
-        
-        # Create property spec
-        prop_spec = vmodl.query.PropertyCollector.PropertySpec(
-            type=mo_type,
-            all=False
-        )
-        prop_spec.pathSet.extend(properties)
-        filter_spec.propSet = [prop_spec]
+        key = (object_type, tuple(sorted(properties)), self.connection_epoch)
+        with self._update_subscriptions_lock:
+            subscription = self._update_subscriptions.get(key)
+            if subscription is None or subscription.closed:
+                # Create property filter spec covering the whole inventory
+                obj_spec = vmodl.query.PropertyCollector.ObjectSpec(
+                    obj=self.content.rootFolder,
+                    selectSet=self._build_traversal_spec()
+                )
+                prop_spec = vmodl.query.PropertyCollector.PropertySpec(
+                    type=mo_type,
+                    all=False
+                )
+                prop_spec.pathSet.extend(properties)
+                filter_spec = vmodl.query.PropertyCollector.FilterSpec(
+                    objectSet=[obj_spec],
+                    propSet=[prop_spec]
+                )
+                # A private collector keeps this subscription's version independent of other callers
+                collector = self.content.propertyCollector.CreatePropertyCollector()
+                subscription = _UpdateSubscription(collector, filter_spec)
+                self._update_subscriptions[key] = subscription
+            # Forget subscriptions that have shut down
+            for stale_key in [k for k, sub in self._update_subscriptions.items() if sub.closed]:
+                del self._update_subscriptions[stale_key]
+        
+        # Version tokens are "<subscription id>:<sequence>"; without a usable one the
+        # caller starts from the current state of every object
+        since = None
+        if version:
+            sub_id, _, sequence = version.partition(":")
+            if sub_id == str(subscription.id) and sequence.isdigit():
+                since = int(sequence)
+        # Set when a version was passed but updates after it are no longer available;
+        # the updates then hold the full current state instead
+        resync = bool(version) and since is None
+        
+        results = []
+        iterations = 0
+        while iterations < max_iterations:
+            truncated = False
+            if since is not None:
+                updates, next_since, truncated = subscription.read(since, max_wait_seconds)
+            if since is None or truncated:
+                # The current state supersedes any partial history collected so far
+                resync = resync or truncated
+                results = []
+                updates, since = subscription.snapshot(max_wait_seconds)
+            else:
+                since = next_since
+            results.extend(updates)
+            iterations += 1
+            if subscription.closed:
+                break
         
-        # Create filter
-        prop_collector = self.content.propertyCollector
-        pc_filter = prop_collector.CreateFilter(filter_spec, True)
+        if subscription.closed and subscription.error and not results:
+            raise Exception(f"Property update subscription failed: {subscription.error}")
         
-        try:
-            # Create wait options
-            wait_opts = vmodl.query.PropertyCollector.WaitOptions()
-            wait_opts.maxWaitSeconds = max_wait_seconds
-            
-            version = ''
-            results = []
-            iterations = 0
-            
-            while iterations < max_iterations:
-                # Wait for updates
-                update_set = prop_collector.WaitForUpdatesEx(version, wait_opts)
-                
-                if update_set is None:
-                    # Timeout, continue
-                    iterations += 1
-                    continue
-                
-                # Process updates
-                for filter_set in update_set.filterSet:
-                    for object_set in filter_set.objectSet:
-                        obj_ref = str(object_set.obj).strip("'")
-                        kind = object_set.kind
-                        
-                        if kind in ('enter', 'modify'):
-                            changes = {}
-                            for change in object_set.changeSet:
-                                changes[change.name] = str(change.val) if change.val else None
-                            
-                            results.append({
-                                "object": obj_ref,
-                                "kind": kind,
-                                "changes": changes
-                            })
-                        elif kind == 'leave':
-                            results.append({
-                                "object": obj_ref,
-                                "kind": "removed"
-                            })
-                
-                version = update_set.version
-                iterations += 1
-            
-            return {
-                "status": "success",
-                "iterations": iterations,
-                "updates": results
-            }
-            
-        finally:
-            # Clean up filter
-            pc_filter.Destroy()
+        return {
+            "status": "success",
+            "iterations": iterations,
+            "version": f"{subscription.id}:{since}",
+            "resync": resync,
+            "updates": results
+        }
 
     def _build_traversal_spec(self):
         """Build traversal spec for property collector."""
-        from pyVmomi import vmodl
-        
         # Traversal spec for folders
         folder_to_child = vmodl.query.PropertyCollector.TraversalSpec(
             name='folderToChild',
@@ -1554,8 +2336,6 @@ class VMwareManager:
     def _acquire_saml_token(self) -> str:
         """Acquire a SAML bearer token from the vCenter STS."""
         import requests
-        import xml.etree.ElementTree as ET
-        from datetime import datetime, timezone, timedelta
 
         now = datetime.now(timezone.utc)
         created = now.strftime("%Y-%m-%dT%H:%M:%S.000Z")
@@ -1638,23 +2418,45 @@ class VMwareManager:
             "or enable SAML auth (VMWARE_SAML_ENABLED=true)."
         )
 
+    def _http_session(self):
+        """Return the requests Session for file transfers, so repeated transfers reuse TLS connections."""
+        session = self._http
+        if session is None:
+            with self._http_lock:
+                session = self._http
+                if session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    from urllib3.util.retry import Retry
+                    session = requests.Session()
+                    # File transfers never verified certificates; set it once for every request
+                    session.verify = False
+                    # One pooled connection per handler thread that may transfer at the same time.
+                    # Only failed connection attempts are retried: a streamed body cannot be resent
+                    session.mount("https://", HTTPAdapter(
+                        pool_maxsize=self.config.vsphere_pool_size,
+                        max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.2)))
+                    self._http = session
+        return session
+
     def _get_session_cookies(self) -> dict:
-        """Return the vSphere session cookie as a dict suitable for requests."""
-        import requests  # noqa: ensure available
-        client_cookie = self.si._stub.cookie
-        cookie_name = client_cookie.split("=", 1)[0]
-        cookie_value = client_cookie.split("=", 1)[1].split(";", 1)[0]
-        cookie_path = (
-            client_cookie.split("=", 1)[1].split(";", 1)[1].split(";", 1)[0].lstrip()
-        )
+        """Return the vSphere session cookie as a dict suitable for requests, parsed once per connection."""
+        if self._session_cookies is None:
+            self._session_cookies = self._parse_session_cookie(self.si._stub.cookie)
+        return self._session_cookies
+
+    @staticmethod
+    def _parse_session_cookie(client_cookie: str) -> dict:
+        """Turn the SOAP stub's Set-Cookie value into the cookie vSphere's file endpoints expect."""
+        # e.g. 'vmware_soap_session="abc"; Path=/; HttpOnly; Secure;'
+        cookie_name, _, rest = client_cookie.partition("=")
+        cookie_value, _, attributes = rest.partition(";")
+        cookie_path = attributes.split(";", 1)[0].lstrip()
         cookie_text = " " + cookie_value + "; $" + cookie_path
         return {cookie_name: cookie_text}
 
     def _download_datastore_file(self, datastore_path: str) -> bytes:
         """Download a file from a datastore path like '[dsName] path/to/file'."""
-        import requests
-        from urllib.parse import quote
-
         match = re.match(r'\[(.+?)\]\s+(.+)', datastore_path)
         if not match:
             raise Exception(f"Invalid datastore path: {datastore_path}")
@@ -1668,7 +2470,7 @@ class VMwareManager:
             "dcPath": self.datacenter_obj.name,
         }
 
-        resp = requests.get(url, params=params, cookies=self._get_session_cookies(), verify=False)
+        resp = self._http_session().get(url, params=params, cookies=self._get_session_cookies())
         if resp.status_code != 200:
             raise Exception(
                 f"Failed to download {datastore_path}: HTTP {resp.status_code}"
@@ -1681,24 +2483,19 @@ class VMwareManager:
         self._ensure_connected()
         vm = self.find_vm(vm_name)
         if not vm:
-            raise Exception(f"VM {vm_name} not found")
+            raise ObjectNotFound(f"VM {vm_name} not found")
 
-        task = vm.CreateScreenshot_Task()
-        while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-            time.sleep(0.5)
-        if task.info.state == vim.TaskInfo.State.error:
-            raise task.info.error
-
-        screenshot_path = task.info.result
+        task = self._issue_task(vm.CreateScreenshot_Task)
+        screenshot_path = self._wait_task(task)
         image_data = self._download_datastore_file(screenshot_path)
 
         try:
             match = re.match(r'\[(.+?)\]\s+(.+)', screenshot_path)
             if match:
-                self.content.fileManager.DeleteDatastoreFile_Task(
+                self._issue_task(lambda: self.content.fileManager.DeleteDatastoreFile_Task(
                     name=screenshot_path,
                     datacenter=self.datacenter_obj
-                )
+                ))
         except Exception as e:
             logging.warning(f"Failed to clean up screenshot file: {e}")
 
@@ -1713,7 +2510,7 @@ class VMwareManager:
         self._ensure_connected()
         vm = self.find_vm(vm_name)
         if not vm:
-            raise Exception(f"VM {vm_name} not found")
+            raise ObjectNotFound(f"VM {vm_name} not found")
 
         for device in vm.config.hardware.device:
             if isinstance(device, vim.vm.device.VirtualSerialPort):
@@ -1744,11 +2541,8 @@ class VMwareManager:
         config_spec = vim.vm.ConfigSpec()
         config_spec.deviceChange = [serial_spec]
 
-        task = vm.ReconfigVM_Task(spec=config_spec)
-        while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-            time.sleep(0.5)
-        if task.info.state == vim.TaskInfo.State.error:
-            raise task.info.error
+        task = self._issue_task(lambda: vm.ReconfigVM_Task(spec=config_spec))
+        self._wait_task(task)
 
         return f"Serial port added to '{vm_name}', logging to {output_file}"
 
@@ -1758,7 +2552,7 @@ class VMwareManager:
         self._ensure_connected()
         vm = self.find_vm(vm_name)
         if not vm:
-            raise Exception(f"VM {vm_name} not found")
+            raise ObjectNotFound(f"VM {vm_name} not found")
 
         serial_file = None
         for device in vm.config.hardware.device:
@@ -16,7 +16,8 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/dylanturn/esxi-mcp-server",
-    packages=find_packages(),
+    packages=find_packages(exclude=["tests", "tests.*"]),
+    package_data={"esxi_mcp_server": ["tool_schemas.json"]},
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -24,16 +25,18 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
         "Topic :: System :: Systems Administration",
         "Topic :: System :: Monitoring",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.10",
     install_requires=requirements,
+    extras_require={
+        # Faster JSON encoding of tool results; the standard library is used otherwise
+        "fast": ["orjson>=3.6.0"],
+    },
     entry_points={
         "console_scripts": [
             "esxi-mcp-server=esxi_mcp_server.__main__:main",
@@ -0,0 +1,73 @@
+"""Tests for the JSON sidecar cache of YAML configuration files."""
+
+import json
+import os
+import stat
+
+from esxi_mcp_server.config import _load_yaml
+
+
+def write_yaml(path, host):
+    path.write_text(f"vcenter_host: {host}\nvcenter_user: admin\n")
+    os.chmod(path, 0o600)
+
+
+def sidecar(path):
+    return path.with_name(path.name + ".cache.json")
+
+
+def test_sidecar_is_written_with_the_yaml_permissions(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    write_yaml(config_path, "vc1")
+
+    assert _load_yaml(str(config_path)) == {"vcenter_host": "vc1", "vcenter_user": "admin"}
+    assert stat.S_IMODE(os.stat(sidecar(config_path)).st_mode) == 0o600
+    # No temporary file is left behind
+    assert sorted(tmp_path.iterdir()) == sorted([config_path, sidecar(config_path)])
+
+
+def test_sidecar_is_reused_while_the_yaml_is_unchanged(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    write_yaml(config_path, "vc1")
+    _load_yaml(str(config_path))
+
+    # A sidecar that no longer matches the YAML's contents proves the YAML was not parsed
+    cached = json.loads(sidecar(config_path).read_text())
+    cached["config"]["vcenter_host"] = "from-cache"
+    sidecar(config_path).write_text(json.dumps(cached))
+
+    assert _load_yaml(str(config_path))["vcenter_host"] == "from-cache"
+
+
+def test_sidecar_is_ignored_after_an_edit(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    write_yaml(config_path, "vc1")
+    _load_yaml(str(config_path))
+
+    write_yaml(config_path, "vc-two")
+
+    assert _load_yaml(str(config_path))["vcenter_host"] == "vc-two"
+
+
+def test_sidecar_is_ignored_when_only_the_mtime_changes(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    write_yaml(config_path, "vc1")
+    _load_yaml(str(config_path))
+    cached = json.loads(sidecar(config_path).read_text())
+    cached["config"]["vcenter_host"] = "from-cache"
+    sidecar(config_path).write_text(json.dumps(cached))
+
+    # An older timestamp, as cp -p or a restored backup would leave
+    source_stat = os.stat(config_path)
+    os.utime(config_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns - 10**9))
+
+    assert _load_yaml(str(config_path))["vcenter_host"] == "vc1"
+
+
+def test_corrupt_sidecar_falls_back_to_the_yaml(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    write_yaml(config_path, "vc1")
+    _load_yaml(str(config_path))
+    sidecar(config_path).write_text("{not json")
+
+    assert _load_yaml(str(config_path))["vcenter_host"] == "vc1"
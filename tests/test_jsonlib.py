@@ -0,0 +1,49 @@
+"""Tests that the orjson and standard-library encoders produce the same JSON."""
+
+import importlib
+import sys
+
+import pytest
+
+from esxi_mcp_server import jsonlib
+from esxi_mcp_server.models import DatastoreClusterInfo, DatastoreInfo, PerformanceCounterInfo, SnapshotInfo
+
+orjson = pytest.importorskip("orjson")
+
+RESULT = {
+    "datastores": [
+        DatastoreInfo(name="ds1", type="VMFS", capacity_gb=100.5, free_space_gb=20.0,
+                      accessible=True, maintenance_mode="normal"),
+    ],
+    "clusters": [DatastoreClusterInfo(name="pod", capacity_gb=1.0, free_space_gb=0.5, datastores=["ds1", "ds2"])],
+    "counters": [PerformanceCounterInfo(key=6, group="cpu", name="usage", rollup_type="average",
+                                        stats_type="rate", unit="percent", description="CPU usage (é)")],
+    "snapshots": [SnapshotInfo(name="before", description=None, create_time="2024-01-01T00:00:00",
+                               state="poweredOff", level=0)],
+    "empty": [],
+}
+
+
+@pytest.fixture
+def stdlib_jsonlib(monkeypatch):
+    """jsonlib as loaded when orjson is not installed."""
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    module = importlib.reload(jsonlib)
+    yield module
+    monkeypatch.undo()
+    importlib.reload(jsonlib)
+
+
+@pytest.mark.parametrize("indent", [False, True])
+def test_stdlib_output_matches_orjson(stdlib_jsonlib, indent):
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    expected = orjson.dumps(RESULT, option=option).decode("utf-8")
+
+    assert stdlib_jsonlib.orjson is None
+    assert stdlib_jsonlib.dumps(RESULT, indent) == expected
+
+
+def test_records_serialize_as_objects():
+    assert jsonlib.loads(jsonlib.dumps(RESULT["clusters"])) == [
+        {"name": "pod", "capacity_gb": 1.0, "free_space_gb": 0.5, "datastores": ["ds1", "ds2"]}
+    ]
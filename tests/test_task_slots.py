@@ -0,0 +1,145 @@
+"""Tests that VMwareManager task slots are held until the task ends, using a fake PropertyCollector."""
+
+import queue
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from types import SimpleNamespace
+
+import pytest
+from pyVmomi import vim
+
+from esxi_mcp_server.config import Config
+from esxi_mcp_server.vmware_manager import VMwareManager, _TaskWatcher
+
+
+class FakeCollector:
+    """Stands in for a private PropertyCollector; tests feed task state changes through finish()."""
+
+    def __init__(self):
+        self.updates = queue.Queue()
+        self.destroyed_filters = 0
+        self.version = 0
+
+    def CreateFilter(self, spec, partialUpdates):
+        return SimpleNamespace(DestroyPropertyFilter=self._destroy_filter)
+
+    def _destroy_filter(self):
+        self.destroyed_filters += 1
+
+    def WaitForUpdatesEx(self, version, options):
+        try:
+            update = self.updates.get(timeout=0.05)
+        except queue.Empty:
+            return None
+        if isinstance(update, Exception):
+            raise update
+        return update
+
+    def finish(self, task, state, error=None):
+        self.version += 1
+        changes = [SimpleNamespace(name="info.state", val=state), SimpleNamespace(name="info.error", val=error)]
+        self.updates.put(SimpleNamespace(
+            version=str(self.version),
+            filterSet=[SimpleNamespace(objectSet=[SimpleNamespace(obj=task, changeSet=changes)])],
+        ))
+
+    def fail(self, error):
+        self.updates.put(error)
+
+
+class OfflineManager(VMwareManager):
+    """VMwareManager that never connects to vCenter."""
+
+    def _connect_vcenter(self):
+        pass
+
+
+@pytest.fixture
+def setup():
+    config = Config(vcenter_host="vc", vcenter_user="user", vcenter_password="secret",
+                    max_concurrent_tasks=2, host_snapshot_limit=1)
+    manager = OfflineManager(config)
+    collector = FakeCollector()
+    manager._task_watcher_obj = _TaskWatcher(collector, manager.connection_epoch)
+    vm = vim.VirtualMachine("vm-1")
+    manager._vm_hosts[vm] = vim.HostSystem("host-1")
+    return manager, collector, vm
+
+
+def host_slot(manager):
+    return manager._host_slots[("snapshot", "host-1")]
+
+
+def is_free(slot):
+    """Whether slot can be taken within a second; it is given back right away."""
+    if slot.acquire(timeout=1):
+        slot.release()
+        return True
+    return False
+
+
+@pytest.mark.parametrize("state", [vim.TaskInfo.State.success, vim.TaskInfo.State.error])
+def test_slots_are_released_when_the_task_ends(setup, state):
+    manager, collector, vm = setup
+    task = manager._issue_task(lambda: vim.Task("task-1"), vm, "snapshot", 1)
+
+    assert not host_slot(manager).acquire(blocking=False)
+    collector.finish(task, state)
+
+    assert is_free(host_slot(manager))
+    # Both global slots are free again
+    assert manager._task_slots.acquire(timeout=1) and manager._task_slots.acquire(timeout=1)
+    assert collector.destroyed_filters == 1
+
+
+def test_slots_stay_held_after_a_wait_times_out(setup):
+    manager, collector, vm = setup
+    task = manager._issue_task(lambda: vim.Task("task-1"), vm, "snapshot", 1)
+
+    # What _wait_task does when config.task_timeout expires
+    with pytest.raises(FutureTimeoutError):
+        manager._task_watcher().watch(task).result(timeout=0.1)
+    assert not host_slot(manager).acquire(blocking=False)
+
+    collector.finish(task, vim.TaskInfo.State.success)
+    assert is_free(host_slot(manager))
+
+
+def test_slots_are_released_when_the_task_cannot_start(setup):
+    manager, collector, vm = setup
+
+    def start():
+        raise vim.fault.InvalidPowerState()
+
+    with pytest.raises(vim.fault.InvalidPowerState):
+        manager._issue_task(start, vm, "snapshot", 1)
+
+    assert host_slot(manager).acquire(blocking=False)
+    host_slot(manager).release()
+    assert manager._task_slots.acquire(blocking=False) and manager._task_slots.acquire(blocking=False)
+
+
+def test_slots_are_released_when_the_watcher_fails(setup):
+    manager, collector, vm = setup
+    manager._issue_task(lambda: vim.Task("task-1"), vm, "snapshot", 1)
+
+    collector.fail(RuntimeError("session lost"))
+
+    assert is_free(host_slot(manager))
+
+
+def test_global_cap_queues_tasks_until_one_ends(setup):
+    manager, collector, vm = setup
+    first = manager._issue_task(lambda: vim.Task("task-1"))
+    manager._issue_task(lambda: vim.Task("task-2"))
+    started = threading.Event()
+
+    def issue_third():
+        manager._issue_task(lambda: vim.Task("task-3"))
+        started.set()
+
+    threading.Thread(target=issue_third, daemon=True).start()
+    assert not started.wait(0.2)
+
+    collector.finish(first, vim.TaskInfo.State.success)
+    assert started.wait(1)
@@ -0,0 +1,161 @@
+"""Tests for the caching, not-found memory and bulk helpers of ToolHandlers."""
+
+import threading
+import time
+from unittest import mock
+
+import pytest
+from cachetools import TTLCache
+
+from esxi_mcp_server.config import Config
+from esxi_mcp_server.tools import ToolHandlers
+from esxi_mcp_server.vmware_manager import ObjectNotFound
+
+
+def make_handlers(**config_options):
+    manager = mock.Mock()
+    config = Config(vcenter_host="vc", vcenter_user="user", vcenter_password="secret", **config_options)
+    return manager, ToolHandlers(manager, config)
+
+
+def run_in_threads(function, count):
+    results = [None] * count
+
+    def run(i):
+        results[i] = function()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_concurrent_reads_share_one_call():
+    manager, handlers = make_handlers()
+    release = threading.Event()
+
+    def list_vms():
+        release.wait(5)
+        return ["vm1", "vm2"]
+
+    manager.list_vms.side_effect = list_vms
+    threads, results = run_in_threads(handlers.list_vms, 5)
+    # Let every follower find the leader's in-flight call before it completes
+    time.sleep(0.2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert manager.list_vms.call_count == 1
+    assert results == [["vm1", "vm2"]] * 5
+
+
+def test_cached_read_is_reused():
+    manager, handlers = make_handlers()
+    manager.list_vms.return_value = ["vm1"]
+
+    assert handlers.list_vms() == ["vm1"]
+    assert handlers.list_vms() == ["vm1"]
+    assert manager.list_vms.call_count == 1
+
+
+def test_invalidation_during_a_read_skips_storing_its_result():
+    manager, handlers = make_handlers()
+    started = threading.Event()
+    release = threading.Event()
+
+    def list_vms():
+        started.set()
+        release.wait(5)
+        return ["old"]
+
+    manager.list_vms.side_effect = list_vms
+    threads, results = run_in_threads(handlers.list_vms, 1)
+    assert started.wait(5)
+    handlers.invalidate_cache()
+    release.set()
+    threads[0].join(5)
+    assert results == [["old"]]
+
+    manager.list_vms.side_effect = None
+    manager.list_vms.return_value = ["new"]
+    assert handlers.list_vms() == ["new"]
+    assert manager.list_vms.call_count == 2
+
+
+def test_failed_read_is_not_cached_and_reaches_followers():
+    manager, handlers = make_handlers()
+    manager.list_vms.side_effect = RuntimeError("vCenter unavailable")
+
+    with pytest.raises(RuntimeError):
+        handlers.list_vms()
+    assert handlers._inflight == {}
+
+    manager.list_vms.side_effect = None
+    manager.list_vms.return_value = ["vm1"]
+    assert handlers.list_vms() == ["vm1"]
+
+
+def test_not_found_is_remembered_until_it_expires():
+    manager, handlers = make_handlers()
+    now = [0.0]
+    handlers._not_found = TTLCache(maxsize=1024, ttl=10, timer=lambda: now[0])
+    manager.get_vm_details.side_effect = ObjectNotFound("VM missing not found")
+
+    for _ in range(2):
+        with pytest.raises(ObjectNotFound, match="VM missing not found"):
+            handlers.get_vm_details("missing")
+    assert manager.get_vm_details.call_count == 1
+
+    now[0] = 11.0
+    with pytest.raises(ObjectNotFound):
+        handlers.get_vm_details("missing")
+    assert manager.get_vm_details.call_count == 2
+
+
+def test_not_found_is_forgotten_after_a_change():
+    manager, handlers = make_handlers()
+    manager.get_vm_details.side_effect = ObjectNotFound("VM new not found")
+    with pytest.raises(ObjectNotFound):
+        handlers.get_vm_details("new")
+
+    handlers.invalidate_cache()
+    manager.get_vm_details.side_effect = None
+    manager.get_vm_details.return_value = {"name": "new"}
+    assert handlers.get_vm_details("new") == {"name": "new"}
+
+
+def test_bulk_results_are_keyed_by_name():
+    manager, handlers = make_handlers()
+
+    def power_on_vm(name, wait):
+        if name == "broken":
+            raise RuntimeError("no host")
+        return f"VM '{name}' powered on."
+
+    manager.power_on_vm.side_effect = power_on_vm
+    results = handlers.bulk_power_on_vms(["a", "broken", "b"])
+
+    assert results == {
+        "a": {"status": "success", "result": "VM 'a' powered on."},
+        "broken": {"status": "error", "error": "no host"},
+        "b": {"status": "success", "result": "VM 'b' powered on."},
+    }
+
+
+def test_bulk_create_keys_results_by_spec_name():
+    manager, handlers = make_handlers()
+    manager.create_vm.return_value = "created"
+
+    results = handlers.bulk_create_vms([{"name": "a", "cpu": 1, "memory": 512}])
+
+    assert results == {"a": {"status": "success", "result": "created"}}
+
+
+def test_bulk_rejects_duplicate_names():
+    manager, handlers = make_handlers()
+
+    with pytest.raises(ValueError, match="Duplicate entries: a"):
+        handlers.bulk_create_vms([{"name": "a", "cpu": 1, "memory": 512},
+                                  {"name": "a", "cpu": 2, "memory": 1024}])
+    manager.create_vm.assert_not_called()